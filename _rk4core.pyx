@@ -0,0 +1,136 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""Cython RK4 kernels for the attractor systems.
+
+Optional alternative to the Numba kernels in attractor_core.py, for setups
+without Numba. Build in place with:
+
+    cythonize -i _rk4core.pyx
+
+Each integrate_* function writes `steps` states into the preallocated
+C-contiguous float64 array `out` of shape (steps, 3), starting with the
+initial state, and mirrors the JIT kernel of the same name.
+"""
+
+from libc.math cimport sin
+
+
+cdef inline void _lorenz(double x, double y, double z, double sigma, double rho, double beta,
+                         double* dx, double* dy, double* dz) noexcept nogil:
+    dx[0] = sigma * (y - x)
+    dy[0] = x * (rho - z) - y
+    dz[0] = x * y - beta * z
+
+
+cdef inline void _rossler(double x, double y, double z, double a, double b, double c,
+                          double* dx, double* dy, double* dz) noexcept nogil:
+    dx[0] = -y - z
+    dy[0] = x + a * y
+    dz[0] = b + z * (x - c)
+
+
+cdef inline void _thomas(double x, double y, double z, double b,
+                         double* dx, double* dy, double* dz) noexcept nogil:
+    dx[0] = sin(y) - b * x
+    dy[0] = sin(z) - b * y
+    dz[0] = sin(x) - b * z
+
+
+cdef inline void _aizawa(double x, double y, double z, double a, double b, double c,
+                         double d, double e, double f,
+                         double* dx, double* dy, double* dz) noexcept nogil:
+    dx[0] = (z - b) * x - d * y
+    dy[0] = d * x + (z - b) * y
+    dz[0] = c + a * z - (z * z * z) / 3 - (x * x + y * y) * (1 + e * z) + f * z * (x * x * x)
+
+
+cpdef integrate_lorenz(double x, double y, double z, double dt, int steps,
+                       double sigma, double rho, double beta, double[:, ::1] out):
+    """RK4-integrate the Lorenz system into out."""
+    cdef double k1x, k1y, k1z, k2x, k2y, k2z, k3x, k3y, k3z, k4x, k4y, k4z
+    cdef double h = 0.5 * dt, w = dt / 6.0
+    cdef int i
+    with nogil:
+        out[0, 0] = x
+        out[0, 1] = y
+        out[0, 2] = z
+        for i in range(1, steps):
+            _lorenz(x, y, z, sigma, rho, beta, &k1x, &k1y, &k1z)
+            _lorenz(x + h * k1x, y + h * k1y, z + h * k1z, sigma, rho, beta, &k2x, &k2y, &k2z)
+            _lorenz(x + h * k2x, y + h * k2y, z + h * k2z, sigma, rho, beta, &k3x, &k3y, &k3z)
+            _lorenz(x + dt * k3x, y + dt * k3y, z + dt * k3z, sigma, rho, beta, &k4x, &k4y, &k4z)
+            x += w * (k1x + 2 * k2x + 2 * k3x + k4x)
+            y += w * (k1y + 2 * k2y + 2 * k3y + k4y)
+            z += w * (k1z + 2 * k2z + 2 * k3z + k4z)
+            out[i, 0] = x
+            out[i, 1] = y
+            out[i, 2] = z
+
+
+cpdef integrate_rossler(double x, double y, double z, double dt, int steps,
+                        double a, double b, double c, double[:, ::1] out):
+    """RK4-integrate the Rössler system into out."""
+    cdef double k1x, k1y, k1z, k2x, k2y, k2z, k3x, k3y, k3z, k4x, k4y, k4z
+    cdef double h = 0.5 * dt, w = dt / 6.0
+    cdef int i
+    with nogil:
+        out[0, 0] = x
+        out[0, 1] = y
+        out[0, 2] = z
+        for i in range(1, steps):
+            _rossler(x, y, z, a, b, c, &k1x, &k1y, &k1z)
+            _rossler(x + h * k1x, y + h * k1y, z + h * k1z, a, b, c, &k2x, &k2y, &k2z)
+            _rossler(x + h * k2x, y + h * k2y, z + h * k2z, a, b, c, &k3x, &k3y, &k3z)
+            _rossler(x + dt * k3x, y + dt * k3y, z + dt * k3z, a, b, c, &k4x, &k4y, &k4z)
+            x += w * (k1x + 2 * k2x + 2 * k3x + k4x)
+            y += w * (k1y + 2 * k2y + 2 * k3y + k4y)
+            z += w * (k1z + 2 * k2z + 2 * k3z + k4z)
+            out[i, 0] = x
+            out[i, 1] = y
+            out[i, 2] = z
+
+
+cpdef integrate_thomas(double x, double y, double z, double dt, int steps,
+                       double b, double[:, ::1] out):
+    """RK4-integrate the Thomas system into out."""
+    cdef double k1x, k1y, k1z, k2x, k2y, k2z, k3x, k3y, k3z, k4x, k4y, k4z
+    cdef double h = 0.5 * dt, w = dt / 6.0
+    cdef int i
+    with nogil:
+        out[0, 0] = x
+        out[0, 1] = y
+        out[0, 2] = z
+        for i in range(1, steps):
+            _thomas(x, y, z, b, &k1x, &k1y, &k1z)
+            _thomas(x + h * k1x, y + h * k1y, z + h * k1z, b, &k2x, &k2y, &k2z)
+            _thomas(x + h * k2x, y + h * k2y, z + h * k2z, b, &k3x, &k3y, &k3z)
+            _thomas(x + dt * k3x, y + dt * k3y, z + dt * k3z, b, &k4x, &k4y, &k4z)
+            x += w * (k1x + 2 * k2x + 2 * k3x + k4x)
+            y += w * (k1y + 2 * k2y + 2 * k3y + k4y)
+            z += w * (k1z + 2 * k2z + 2 * k3z + k4z)
+            out[i, 0] = x
+            out[i, 1] = y
+            out[i, 2] = z
+
+
+cpdef integrate_aizawa(double x, double y, double z, double dt, int steps,
+                       double a, double b, double c, double d, double e, double f,
+                       double[:, ::1] out):
+    """RK4-integrate the Aizawa system into out."""
+    cdef double k1x, k1y, k1z, k2x, k2y, k2z, k3x, k3y, k3z, k4x, k4y, k4z
+    cdef double h = 0.5 * dt, w = dt / 6.0
+    cdef int i
+    with nogil:
+        out[0, 0] = x
+        out[0, 1] = y
+        out[0, 2] = z
+        for i in range(1, steps):
+            _aizawa(x, y, z, a, b, c, d, e, f, &k1x, &k1y, &k1z)
+            _aizawa(x + h * k1x, y + h * k1y, z + h * k1z, a, b, c, d, e, f, &k2x, &k2y, &k2z)
+            _aizawa(x + h * k2x, y + h * k2y, z + h * k2z, a, b, c, d, e, f, &k3x, &k3y, &k3z)
+            _aizawa(x + dt * k3x, y + dt * k3y, z + dt * k3z, a, b, c, d, e, f, &k4x, &k4y, &k4z)
+            x += w * (k1x + 2 * k2x + 2 * k3x + k4x)
+            y += w * (k1y + 2 * k2y + 2 * k3y + k4y)
+            z += w * (k1z + 2 * k2z + 2 * k3z + k4z)
+            out[i, 0] = x
+            out[i, 1] = y
+            out[i, 2] = z
@@ -0,0 +1,1336 @@
+"""Numerical core of the Attractor Explorer: attractor definitions and integrators.
+
+Kept free of GUI imports so the integrators can be used, and tested, without
+Qt or matplotlib. attractors.py builds the GUI on top of this module.
+"""
+
+import math
+import inspect
+from importlib.util import find_spec
+import numpy as np
+
+try:
+    from numba import njit, prange, typeof
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit so kernels still run as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    # Optional GPU path for large trajectory batches
+    from numba import cuda
+    HAVE_CUDA = cuda.is_available()
+except Exception:
+    HAVE_CUDA = False
+
+try:
+    # Optional Cython kernels (build with: cythonize -i _rk4core.pyx)
+    import _rk4core
+    HAVE_CYTHON_CORE = True
+except ImportError:
+    HAVE_CYTHON_CORE = False
+
+# SciPy (adaptive solvers) and SymPy (symbolic RK4 expansion for the fixed-dt
+# steppers) are optional and take about 0.4 s each to import, so they are only
+# looked up here and imported on first use
+HAVE_SCIPY = find_spec("scipy") is not None
+HAVE_SYMPY = find_spec("sympy") is not None
+
+# Batches at least this large are integrated on the GPU when CUDA is available;
+# smaller ones don't amortize the kernel launch and transfers
+CUDA_MIN_BATCH = 256
+
+
+@njit(cache=True)
+def lorenz(x, y, z, sigma, rho, beta):
+    """Compute derivatives for the Lorenz attractor system.
+
+    Args:
+        x, y, z: Current state coordinates
+        sigma, rho, beta: System parameters
+
+    Returns:
+        Tuple of derivatives (dx/dt, dy/dt, dz/dt)
+    """
+    dx = sigma * (y - x)
+    dy = x * (rho - z) - y
+    dz = x * y - beta * z
+    return dx, dy, dz
+
+
+@njit(cache=True)
+def rossler(x, y, z, a, b, c):
+    """Compute derivatives for the Rössler attractor system.
+
+    Args:
+        x, y, z: Current state coordinates
+        a, b, c: System parameters
+
+    Returns:
+        Tuple of derivatives (dx/dt, dy/dt, dz/dt)
+    """
+    dx = -y - z
+    dy = x + a * y
+    dz = b + z * (x - c)
+    return dx, dy, dz
+
+
+@njit(cache=True)
+def thomas(x, y, z, b):
+    """Compute derivatives for the Thomas attractor system.
+
+    Args:
+        x, y, z: Current state coordinates
+        b: Damping parameter
+
+    Returns:
+        Tuple of derivatives (dx/dt, dy/dt, dz/dt)
+    """
+    # np.sin keeps this usable on the vector lanes of integrate_batch; under
+    # Numba it compiles to the same scalar libm call as math.sin
+    dx = np.sin(y) - b * x
+    dy = np.sin(z) - b * y
+    dz = np.sin(x) - b * z
+    return dx, dy, dz
+
+
+# Multiplying by a constant is cheaper than dividing, in Python and in the JIT
+ONE_THIRD = 1.0 / 3.0
+
+
+@njit(cache=True)
+def aizawa(x, y, z, a, b, c, d, e, f):
+    """Compute derivatives for the Aizawa attractor system.
+
+    Args:
+        x, y, z: Current state coordinates
+        a, b, c, d, e, f: System parameters
+
+    Returns:
+        Tuple of derivatives (dx/dt, dy/dt, dz/dt)
+    """
+    # Explicit products instead of ** (float.__pow__ is several times slower)
+    x2 = x * x
+    zb = z - b
+    dx = zb * x - d * y
+    dy = d * x + zb * y
+    dz = c + a * z - z * z * z * ONE_THIRD - (x2 + y * y) * (1 + e * z) + f * z * x2 * x
+    return dx, dy, dz
+
+
+# Parameter-bound derivatives.
+#
+# Each factory reads the parameter dict once and returns a closure of (x, y, z)
+# with the parameters captured as locals. Interpreted hot loops (the animation
+# step, solve_ivp callbacks) call these instead of re-passing parameters on
+# every RK4 stage.
+
+def make_lorenz(p):
+    """Return the Lorenz derivative with parameters bound from dict p."""
+    sigma, rho, beta = p["sigma"], p["rho"], p["beta"]
+
+    def deriv(x, y, z):
+        return sigma * (y - x), x * (rho - z) - y, x * y - beta * z
+    return deriv
+
+
+def make_rossler(p):
+    """Return the Rössler derivative with parameters bound from dict p."""
+    a, b, c = p["a"], p["b"], p["c"]
+
+    def deriv(x, y, z):
+        return -y - z, x + a * y, b + z * (x - c)
+    return deriv
+
+
+def make_thomas(p):
+    """Return the Thomas derivative with parameters bound from dict p."""
+    b = p["b"]
+
+    def deriv(x, y, z):
+        return math.sin(y) - b * x, math.sin(z) - b * y, math.sin(x) - b * z
+    return deriv
+
+
+def make_aizawa(p):
+    """Return the Aizawa derivative with parameters bound from dict p."""
+    a, b, c, d, e, f = p["a"], p["b"], p["c"], p["d"], p["e"], p["f"]
+
+    def deriv(x, y, z):
+        x2 = x * x
+        zb = z - b
+        return (zb * x - d * y,
+                d * x + zb * y,
+                c + a * z - z * z * z * ONE_THIRD - (x2 + y * y) * (1 + e * z) + f * z * x2 * x)
+    return deriv
+
+
+ATTRACTORS = {
+    "Lorenz": {
+        "deriv": lorenz,
+        "make_deriv": make_lorenz,
+        "rhs": ("sigma * (y - x)", "x * (rho - z) - y", "x * y - beta * z"),
+        "params": {"sigma": 10.0, "rho": 28.0, "beta": 8.0 / 3.0},
+        "init": [0.1, 0.0, 0.0],
+        "equations": [
+            "dx/dt = σ(y - x)",
+            "dy/dt = x(ρ - z) - y",
+            "dz/dt = xy - βz"
+        ],
+        "description": "The Lorenz attractor is a set of chaotic solutions to the Lorenz system, discovered by Edward Lorenz in 1963. It represents a simplified model of atmospheric convection and is one of the most iconic examples of chaos theory. The system exhibits sensitive dependence on initial conditions - the famous 'butterfly effect'. The attractor has a distinctive butterfly or figure-8 shape with two lobes.",
+        "tooltips": {
+            "sigma": "Prandtl number - ratio of momentum to thermal diffusivity",
+            "rho": "Rayleigh number - temperature difference driving convection",
+            "beta": "Geometric factor related to physical dimensions"
+        }
+    },
+    "Rossler": {
+        "deriv": rossler,
+        "make_deriv": make_rossler,
+        "rhs": ("-y - z", "x + a * y", "b + z * (x - c)"),
+        "params": {"a": 0.2, "b": 0.2, "c": 5.7},
+        "init": [0.0, 1.0, 0.0],
+        "equations": [
+            "dx/dt = -y - z",
+            "dy/dt = x + ay",
+            "dz/dt = b + z(x - c)"
+        ],
+        "description": "The Rössler attractor, discovered by Otto Rössler in 1976, is a system of three nonlinear ordinary differential equations that exhibit chaotic behavior. It was originally designed to be simpler than the Lorenz attractor while still displaying continuous chaos. The attractor produces a characteristic spiral pattern that folds back on itself, creating a band-like structure in phase space.",
+        "tooltips": {
+            "a": "Controls rate of rotation in xy-plane",
+            "b": "Linear term in z equation",
+            "c": "Controls z-height of rotation center"
+        }
+    },
+    "Thomas": {
+        "deriv": thomas,
+        "make_deriv": make_thomas,
+        "rhs": ("sin(y) - b * x", "sin(z) - b * y", "sin(x) - b * z"),
+        "params": {"b": 0.208186},
+        "init": [0.1, 0.0, 0.0],
+        "equations": [
+            "dx/dt = sin(y) - bx",
+            "dy/dt = sin(z) - by",
+            "dz/dt = sin(x) - bz"
+        ],
+        "description": "The Thomas attractor is a cyclically symmetric chaotic system discovered by René Thomas. It features time-reversal symmetry and exhibits a smooth flowing pattern. The attractor is characterized by its elegant, intertwined looping structure that demonstrates conservative chaos. The parameter b controls the damping, with the standard value of ~0.208186 producing particularly aesthetic trajectories.",
+        "tooltips": {
+            "b": "Damping parameter - controls dissipation rate"
+        }
+    },
+    "Aizawa": {
+        "deriv": aizawa,
+        "make_deriv": make_aizawa,
+        # Explicit products, as in aizawa(): emit_stepper pastes these in as is
+        "rhs": ("(z - b) * x - d * y", "d * x + (z - b) * y",
+                "c + a * z - z * z * z / 3 - (x * x + y * y) * (1 + e * z) + f * z * x * x * x"),
+        "params": {"a": 0.95, "b": 0.7, "c": 0.6, "d": 3.5, "e": 0.25, "f": 0.1},
+        "init": [0.1, 0.0, 0.0],
+        "equations": [
+            "dx/dt = (z - b)x - dy",
+            "dy/dt = dx + (z - b)y",
+            "dz/dt = c + az - z³/3 - (x² + y²)(1 + ez) + fz(x³)"
+        ],
+        "description": "The Aizawa attractor is a complex chaotic system with rich dynamic behavior. It produces intricate toroidal structures with multiple twisted bands. The system has six parameters that can be tuned to produce a variety of different attractor shapes, from simple limit cycles to highly complex strange attractors. The standard parameter set creates a distinctive multi-lobed structure.",
+        "tooltips": {
+            "a": "Linear z coefficient",
+            "b": "Shift parameter for x and y equations",
+            "c": "Constant term in z equation",
+            "d": "Coupling coefficient between x and y",
+            "e": "Nonlinear z coupling factor",
+            "f": "Cubic x coupling to z"
+        }
+    },
+}
+
+
+def param_values(attractor_name, params):
+    """Return an attractor's parameters as floats in derivative argument order.
+
+    The order is that of ATTRACTORS[attractor_name]["params"], whatever the
+    order of the given dictionary. Kernels take these positionally, so no
+    dictionary lookups happen inside the integration loops.
+
+    Args:
+        attractor_name: Key into ATTRACTORS
+        params: Dictionary of parameters for the attractor
+
+    Returns:
+        Tuple of floats
+    """
+    return tuple(float(params[pname]) for pname in ATTRACTORS[attractor_name]["params"])
+
+
+def _check_steps(steps):
+    """Raise ValueError unless steps is at least 1.
+
+    The compiled kernels write the initial state to out[0] without bounds
+    checks, so an empty output array must never reach them.
+    """
+    if steps < 1:
+        raise ValueError(f"steps must be at least 1, got {steps}")
+
+
+def _bind_params(deriv, params):
+    """Return the values of params in the order of deriv's parameter arguments.
+
+    Values are looked up by the derivative's argument names (everything after
+    x, y, z), so the key order of the dictionary does not matter.
+
+    Args:
+        deriv: Derivative function taking (x, y, z, *params)
+        params: Dictionary of parameters, keyed by argument name
+
+    Returns:
+        Tuple of parameter values
+    """
+    names = list(inspect.signature(deriv).parameters)[3:]
+    return tuple(params[name] for name in names)
+
+
+def rk4_integrate(deriv, initial, params, dt, steps, dtype=float):
+    """Integrate a chaotic system using 4th-order Runge-Kutta method.
+
+    This is the classical RK4 method, which provides high accuracy for
+    chaotic systems while being computationally efficient. The state is
+    carried as three scalars so no temporary arrays are built per stage;
+    only the output buffer is allocated. JIT-compiled derivatives are called
+    through their Python body, which is cheaper than a Numba dispatch from
+    interpreted code.
+
+    Args:
+        deriv: Derivative function taking (x, y, z, *params) and returning a 3-tuple
+        initial: Initial state [x0, y0, z0]
+        params: Dictionary of parameters, keyed by the derivative's argument names
+        dt: Time step size (smaller = more accurate but slower)
+        steps: Number of integration steps to compute
+        dtype: Storage type of the returned array. The state is always
+            advanced in double precision; np.float32 only rounds the stored
+            points, which is plenty for plotting and halves the memory.
+
+    Returns:
+        Numpy array of shape (steps, 3) containing the trajectory
+
+    Performance:
+        ~200ms for 20,000 steps on typical hardware
+    """
+    f = getattr(deriv, "py_func", deriv)
+    p = _bind_params(f, params)
+    bound = lambda x, y, z: f(x, y, z, *p)
+    data = np.empty((steps, 3), dtype=dtype)
+    x, y, z = (float(v) for v in initial)
+    data[0, 0], data[0, 1], data[0, 2] = x, y, z
+    for i in range(1, steps):
+        x, y, z = rk4_step(bound, x, y, z, dt)
+        data[i, 0], data[i, 1], data[i, 2] = x, y, z
+    return data
+
+
+def rk4_step(deriv, x, y, z, dt):
+    """Advance a scalar state by one classical RK4 step.
+
+    Args:
+        deriv: Parameter-bound derivative taking (x, y, z) and returning a 3-tuple
+        x, y, z: Current state coordinates
+        dt: Time step size
+
+    Returns:
+        Tuple (x, y, z) of the new state
+    """
+    h, w = 0.5 * dt, dt / 6.0
+    k1x, k1y, k1z = deriv(x, y, z)
+    k2x, k2y, k2z = deriv(x + h * k1x, y + h * k1y, z + h * k1z)
+    k3x, k3y, k3z = deriv(x + h * k2x, y + h * k2y, z + h * k2z)
+    k4x, k4y, k4z = deriv(x + dt * k3x, y + dt * k3y, z + dt * k3z)
+    return (x + w * (k1x + 2 * k2x + 2 * k3x + k4x),
+            y + w * (k1y + 2 * k2y + 2 * k3y + k4y),
+            z + w * (k1z + 2 * k2z + 2 * k3z + k4z))
+
+
+def rk4_step_inplace(deriv, state, dt, acc, tmp, k):
+    """Advance a (3, B) state array by one RK4 step without temporaries.
+
+    Each stage's derivative is copied into a (3, B) buffer so the stage
+    inputs and the weighted k-sum are whole-block in-place ufuncs on
+    caller-owned scratch arrays; a step allocates only the arrays returned
+    by the derivative itself.
+
+    Args:
+        deriv: Parameter-bound derivative taking (x, y, z) and returning a 3-tuple
+        state: State array of shape (3, B), updated in place
+        dt: Time step size
+        acc: Scratch array of shape (3, B) for the weighted k-sum
+        tmp: Scratch array of shape (3, B) for the stage inputs
+        k: Scratch array of shape (3, B) for the current stage derivative
+    """
+    k[0], k[1], k[2] = deriv(state[0], state[1], state[2])
+    np.copyto(acc, k)
+    for coef, weight in ((0.5 * dt, 2), (0.5 * dt, 2), (dt, 1)):
+        np.multiply(k, coef, out=tmp)
+        tmp += state
+        k[0], k[1], k[2] = deriv(tmp[0], tmp[1], tmp[2])
+        for _ in range(weight):
+            acc += k
+    acc *= dt / 6.0
+    state += acc
+
+
+def integrate_batch(deriv, inits, params, dt, steps):
+    """Integrate many independent trajectories at once with RK4.
+
+    The B initial conditions are packed as lanes of length-B vectors, so each
+    RK4 stage is a handful of NumPy expressions over contiguous arrays rather
+    than B separate Python loops. The scalar derivative functions work
+    unchanged on these vectors.
+
+    Args:
+        deriv: Derivative function taking (x, y, z, *params) and returning a 3-tuple
+        inits: Initial states, array-like of shape (B, 3)
+        params: Dictionary of parameters, keyed by the derivative's argument names
+        dt: Time step size
+        steps: Number of integration steps to compute
+
+    Returns:
+        Numpy array of shape (steps, B, 3) containing all trajectories
+    """
+    # Use the Python body of JIT-compiled derivatives: NumPy already vectorizes
+    # the per-lane arithmetic, and this avoids compiling an array specialization
+    f = getattr(deriv, "py_func", deriv)
+    p = _bind_params(f, params)
+    bound = lambda x, y, z: f(x, y, z, *p)
+    inits = np.asarray(inits, dtype=float).reshape(-1, 3)
+    data = np.empty((steps, inits.shape[0], 3), dtype=float)
+    data[0] = inits
+
+    # State and scratch buffers are allocated once, outside the step loop.
+    # The state is an explicit copy: for B == 1, inits.T already counts as
+    # contiguous and would otherwise be updated in place.
+    state = inits.T.copy()
+    acc = np.empty_like(state)
+    tmp = np.empty_like(state)
+    k = np.empty_like(state)
+    for i in range(1, steps):
+        rk4_step_inplace(bound, state, dt, acc, tmp, k)
+        data[i] = state.T
+    return data
+
+
+# Tsitouras 5(4) coefficients (Tsitouras 2011). The final stage is evaluated at
+# the new state, so it doubles as the first stage of the next step (FSAL).
+TSIT5_A21 = 0.161
+TSIT5_A31, TSIT5_A32 = -0.008480655492356989, 0.335480655492357
+TSIT5_A41, TSIT5_A42, TSIT5_A43 = 2.897153057105493, -6.359448489975075, 4.3622954328695815
+TSIT5_A51, TSIT5_A52, TSIT5_A53, TSIT5_A54 = (5.325864828439257, -11.748883564062828,
+                                              7.4955393428898365, -0.09249506636175525)
+TSIT5_A61, TSIT5_A62, TSIT5_A63, TSIT5_A64, TSIT5_A65 = (5.86145544294642, -12.92096931784711,
+                                                         8.159367898576159, -0.071584973281401,
+                                                         -0.028269050394068383)
+TSIT5_B1, TSIT5_B2, TSIT5_B3, TSIT5_B4, TSIT5_B5, TSIT5_B6 = (0.09646076681806523, 0.01,
+                                                              0.4798896504144996, 1.379008574103742,
+                                                              -3.290069515436081, 2.324710524099774)
+# Difference between the 5th-order weights above and the embedded 4th-order
+# ones; the last applies to the FSAL stage. dt * sum(E_i * k_i) estimates the
+# local error of a step.
+TSIT5_E1, TSIT5_E2, TSIT5_E3, TSIT5_E4, TSIT5_E5, TSIT5_E6, TSIT5_E7 = (
+    -0.00178001105222577714, -0.0008164344596567469, 0.007880878010261995, -0.1447110071732629,
+    0.5823571654525552, -0.45808210592918697, 0.015151515151515152)
+
+
+@njit
+def tsit5_step(deriv, x, y, z, dt, k1, params):
+    """Advance one fixed step with the 5th-order Tsitouras (Tsit5) method.
+
+    Tsit5 is FSAL: the derivative at the new state is returned so the next
+    step can use it as its first stage, leaving six evaluations per step.
+
+    Args:
+        deriv: Derivative function taking (x, y, z, *params)
+        x, y, z: Current state
+        dt: Time step size
+        k1: Derivative at (x, y, z), i.e. the k7 returned by the previous step
+        params: Tuple of parameters in the derivative's argument order
+
+    Returns:
+        Tuple (x, y, z, k7, err, stages) of the new state, the derivative
+        there, the embedded local error estimate (ex, ey, ez) and the stage
+        derivatives (k2, ..., k6) for the continuous extension
+    """
+    k1x, k1y, k1z = k1
+    k2x, k2y, k2z = deriv(x + dt * TSIT5_A21 * k1x,
+                          y + dt * TSIT5_A21 * k1y,
+                          z + dt * TSIT5_A21 * k1z, *params)
+    k3x, k3y, k3z = deriv(x + dt * (TSIT5_A31 * k1x + TSIT5_A32 * k2x),
+                          y + dt * (TSIT5_A31 * k1y + TSIT5_A32 * k2y),
+                          z + dt * (TSIT5_A31 * k1z + TSIT5_A32 * k2z), *params)
+    k4x, k4y, k4z = deriv(x + dt * (TSIT5_A41 * k1x + TSIT5_A42 * k2x + TSIT5_A43 * k3x),
+                          y + dt * (TSIT5_A41 * k1y + TSIT5_A42 * k2y + TSIT5_A43 * k3y),
+                          z + dt * (TSIT5_A41 * k1z + TSIT5_A42 * k2z + TSIT5_A43 * k3z), *params)
+    k5x, k5y, k5z = deriv(x + dt * (TSIT5_A51 * k1x + TSIT5_A52 * k2x + TSIT5_A53 * k3x + TSIT5_A54 * k4x),
+                          y + dt * (TSIT5_A51 * k1y + TSIT5_A52 * k2y + TSIT5_A53 * k3y + TSIT5_A54 * k4y),
+                          z + dt * (TSIT5_A51 * k1z + TSIT5_A52 * k2z + TSIT5_A53 * k3z + TSIT5_A54 * k4z),
+                          *params)
+    k6x, k6y, k6z = deriv(x + dt * (TSIT5_A61 * k1x + TSIT5_A62 * k2x + TSIT5_A63 * k3x
+                                    + TSIT5_A64 * k4x + TSIT5_A65 * k5x),
+                          y + dt * (TSIT5_A61 * k1y + TSIT5_A62 * k2y + TSIT5_A63 * k3y
+                                    + TSIT5_A64 * k4y + TSIT5_A65 * k5y),
+                          z + dt * (TSIT5_A61 * k1z + TSIT5_A62 * k2z + TSIT5_A63 * k3z
+                                    + TSIT5_A64 * k4z + TSIT5_A65 * k5z), *params)
+    x += dt * (TSIT5_B1 * k1x + TSIT5_B2 * k2x + TSIT5_B3 * k3x + TSIT5_B4 * k4x + TSIT5_B5 * k5x + TSIT5_B6 * k6x)
+    y += dt * (TSIT5_B1 * k1y + TSIT5_B2 * k2y + TSIT5_B3 * k3y + TSIT5_B4 * k4y + TSIT5_B5 * k5y + TSIT5_B6 * k6y)
+    z += dt * (TSIT5_B1 * k1z + TSIT5_B2 * k2z + TSIT5_B3 * k3z + TSIT5_B4 * k4z + TSIT5_B5 * k5z + TSIT5_B6 * k6z)
+    k7x, k7y, k7z = deriv(x, y, z, *params)
+    err = (dt * (TSIT5_E1 * k1x + TSIT5_E2 * k2x + TSIT5_E3 * k3x + TSIT5_E4 * k4x
+                 + TSIT5_E5 * k5x + TSIT5_E6 * k6x + TSIT5_E7 * k7x),
+           dt * (TSIT5_E1 * k1y + TSIT5_E2 * k2y + TSIT5_E3 * k3y + TSIT5_E4 * k4y
+                 + TSIT5_E5 * k5y + TSIT5_E6 * k6y + TSIT5_E7 * k7y),
+           dt * (TSIT5_E1 * k1z + TSIT5_E2 * k2z + TSIT5_E3 * k3z + TSIT5_E4 * k4z
+                 + TSIT5_E5 * k5z + TSIT5_E6 * k6z + TSIT5_E7 * k7z))
+    return x, y, z, (k7x, k7y, k7z), err, ((k2x, k2y, k2z), (k3x, k3y, k3z), (k4x, k4y, k4z),
+                                          (k5x, k5y, k5z), (k6x, k6y, k6z))
+
+
+@njit(cache=True)
+def tsit5_dense_weights(s):
+    """Weights b1(s)..b7(s) of the Tsit5 continuous extension.
+
+    The state at fraction s of a step of size h from y is
+    y + h * sum(b_i(s) * k_i), 4th-order accurate anywhere in the step; at
+    s = 1 the weights are the step's own B coefficients.
+    """
+    s2 = s * s
+    return (-1.0530884977290216 * s * (s - 1.3299890189751412) * (s2 - 1.4364028541716351 * s + 0.7139816917074209),
+            0.1017 * s2 * (s2 - 2.1966568338249754 * s + 1.2949852507374631),
+            2.490627285651252793 * s2 * (s2 - 2.38535645472061657 * s + 1.57803468208092486),
+            -16.54810288924490272 * (s - 1.21712927295533244) * (s - 0.61620406037800089) * s2,
+            47.37952196281928122 * (s - 1.203071208372362603) * (s - 0.658047292653547382) * s2,
+            -34.87065786149660974 * (s - 1.2) * (s - 0.666666666666666667) * s2,
+            2.5 * (s - 1.0) * (s - 0.6) * s2)
+
+
+@njit
+def _tsit5_kernel(deriv, x, y, z, dt, steps, params):
+    """Fixed-step Tsit5 driver forwarding the FSAL stage between steps (JIT-compiled)."""
+    out = np.empty((steps, 3))
+    out[0, 0], out[0, 1], out[0, 2] = x, y, z
+    k = deriv(x, y, z, *params)
+    for i in range(1, steps):
+        x, y, z, k, _, _ = tsit5_step(deriv, x, y, z, dt, k, params)
+        out[i, 0], out[i, 1], out[i, 2] = x, y, z
+    return out
+
+
+@njit
+def _tsit5_adaptive_kernel(deriv, x, y, z, dt, steps, params, rtol, atol):
+    """Error-controlled Tsit5 driver sampled every dt (JIT-compiled).
+
+    Steps are sized by the error estimate alone, not by the sample spacing,
+    so at loose tolerances one step spans several samples. Samples inside an
+    accepted step come from the Tsit5 continuous extension, which reuses the
+    step's stages and costs no extra derivative evaluations. As with
+    solve_ivp's dense output, the interpolation error stays in the samples
+    and never feeds back into the integration.
+    """
+    out = np.empty((steps, 3))
+    out[0, 0], out[0, 1], out[0, 2] = x, y, z
+    k = deriv(x, y, z, *params)
+    h = dt
+    span = (steps - 1) * dt  # No step needs to be longer than the whole run
+    t = 0.0
+    i = 1  # Next sample, due at time i * dt
+    while i < steps:
+        nx, ny, nz, nk, (ex, ey, ez), (k2, k3, k4, k5, k6) = tsit5_step(deriv, x, y, z, h, k, params)
+        # RMS of the error relative to the mixed tolerance, as in solve_ivp
+        err = math.sqrt(((ex / (atol + rtol * max(abs(x), abs(nx)))) ** 2
+                         + (ey / (atol + rtol * max(abs(y), abs(ny)))) ** 2
+                         + (ez / (atol + rtol * max(abs(z), abs(nz)))) ** 2) / 3.0)
+        # A diverged state gives a NaN or inf estimate; NaN compares False
+        # against everything, so it would pass for an accepted step forever
+        if not math.isfinite(err) or not math.isfinite(h):
+            raise RuntimeError("Adaptive Tsit5 error estimate is not finite; the trajectory diverged")
+        factor = 5.0 if err == 0.0 else min(5.0, max(0.2, 0.9 * err ** -0.2))
+        if not err <= 1.0:
+            h *= factor
+            if h < 1e-12 * dt:
+                raise RuntimeError("Adaptive Tsit5 step size underflow")
+            continue
+
+        t_end = t + h
+        while i < steps and i * dt <= t_end:
+            b1, b2, b3, b4, b5, b6, b7 = tsit5_dense_weights((i * dt - t) / h)
+            for j, v in enumerate((x, y, z)):
+                out[i, j] = v + h * (b1 * k[j] + b2 * k2[j] + b3 * k3[j] + b4 * k4[j]
+                                     + b5 * k5[j] + b6 * k6[j] + b7 * nk[j])
+            i += 1
+        x, y, z, k = nx, ny, nz, nk
+        t = t_end
+        h = min(h * factor, span)
+    return out
+
+
+def integrate_tsit5(attractor_name, initial, params, dt, steps):
+    """Integrate a named attractor with the fixed-step 5th-order Tsit5 method.
+
+    More accurate than RK4 at the same dt (error O(dt^5) vs O(dt^4)) for 1.5x
+    the derivative evaluations per step, so it pays off when dt can be raised.
+
+    Args:
+        attractor_name: Key into ATTRACTORS
+        initial: Initial state [x0, y0, z0]
+        params: Dictionary of parameters for the attractor
+        dt: Time step size
+        steps: Number of integration steps to compute
+
+    Returns:
+        Numpy array of shape (steps, 3) containing the trajectory
+
+    Raises:
+        ValueError: If steps is less than 1
+
+    Performance:
+        The kernel takes the derivative as an argument, so it is compiled once
+        per attractor per session rather than cached on disk.
+    """
+    _check_steps(steps)
+    deriv = ATTRACTORS[attractor_name]["deriv"]
+    p = param_values(attractor_name, params)
+    x0, y0, z0 = (float(v) for v in initial)
+    return _tsit5_kernel(deriv, x0, y0, z0, float(dt), int(steps), p)
+
+
+def integrate_tsit5_adaptive(attractor_name, initial, params, dt, steps, rtol=1e-8, atol=1e-10):
+    """Integrate a named attractor with error-controlled Tsit5, sampled every dt.
+
+    The accuracy of integrate_adaptive, but the whole step loop, derivative
+    included, runs in compiled code: solve_ivp calls back into Python for
+    every derivative evaluation and cannot take a compiled right-hand side.
+
+    Args:
+        attractor_name: Key into ATTRACTORS
+        initial: Initial state [x0, y0, z0]
+        params: Dictionary of parameters for the attractor
+        dt: Spacing of the output samples
+        steps: Number of output samples
+        rtol: Relative tolerance
+        atol: Absolute tolerance
+
+    Returns:
+        Numpy array of shape (steps, 3) containing the trajectory
+
+    Raises:
+        ValueError: If steps is less than 1 or dt is not a positive number
+        RuntimeError: If the trajectory diverges or the step size underflows
+    """
+    _check_steps(steps)
+    dt = float(dt)
+    if not (math.isfinite(dt) and dt > 0.0):
+        raise ValueError(f"dt must be a positive finite number, got {dt}")
+    deriv = ATTRACTORS[attractor_name]["deriv"]
+    p = param_values(attractor_name, params)
+    x0, y0, z0 = (float(v) for v in initial)
+    return _tsit5_adaptive_kernel(deriv, x0, y0, z0, dt, int(steps), p, float(rtol), float(atol))
+
+
+# JIT-compiled integration kernels.
+#
+# Each attractor has a dedicated RK4 driver around its scalar derivative that
+# writes into a single preallocated (steps, 3) array.
+# Parameters are positional scalars rather than a dict so Numba can type them,
+# and the loop body never constructs a temporary ndarray.
+
+@njit(cache=True)
+def integrate_lorenz(x0, y0, z0, dt, steps, sigma, rho, beta):
+    """RK4-integrate the Lorenz system with scalar state (JIT-compiled)."""
+    out = np.empty((steps, 3))
+    x, y, z = x0, y0, z0
+    out[0, 0], out[0, 1], out[0, 2] = x, y, z
+    h, w = 0.5 * dt, dt / 6.0
+    for i in range(1, steps):
+        k1x, k1y, k1z = lorenz(x, y, z, sigma, rho, beta)
+        k2x, k2y, k2z = lorenz(x + h * k1x, y + h * k1y, z + h * k1z, sigma, rho, beta)
+        k3x, k3y, k3z = lorenz(x + h * k2x, y + h * k2y, z + h * k2z, sigma, rho, beta)
+        k4x, k4y, k4z = lorenz(x + dt * k3x, y + dt * k3y, z + dt * k3z, sigma, rho, beta)
+        x += w * (k1x + 2 * k2x + 2 * k3x + k4x)
+        y += w * (k1y + 2 * k2y + 2 * k3y + k4y)
+        z += w * (k1z + 2 * k2z + 2 * k3z + k4z)
+        out[i, 0], out[i, 1], out[i, 2] = x, y, z
+    return out
+
+
+@njit(cache=True)
+def integrate_rossler(x0, y0, z0, dt, steps, a, b, c):
+    """RK4-integrate the Rössler system with scalar state (JIT-compiled)."""
+    out = np.empty((steps, 3))
+    x, y, z = x0, y0, z0
+    out[0, 0], out[0, 1], out[0, 2] = x, y, z
+    h, w = 0.5 * dt, dt / 6.0
+    for i in range(1, steps):
+        k1x, k1y, k1z = rossler(x, y, z, a, b, c)
+        k2x, k2y, k2z = rossler(x + h * k1x, y + h * k1y, z + h * k1z, a, b, c)
+        k3x, k3y, k3z = rossler(x + h * k2x, y + h * k2y, z + h * k2z, a, b, c)
+        k4x, k4y, k4z = rossler(x + dt * k3x, y + dt * k3y, z + dt * k3z, a, b, c)
+        x += w * (k1x + 2 * k2x + 2 * k3x + k4x)
+        y += w * (k1y + 2 * k2y + 2 * k3y + k4y)
+        z += w * (k1z + 2 * k2z + 2 * k3z + k4z)
+        out[i, 0], out[i, 1], out[i, 2] = x, y, z
+    return out
+
+
+@njit(cache=True)
+def integrate_thomas(x0, y0, z0, dt, steps, b):
+    """RK4-integrate the Thomas system with scalar state (JIT-compiled)."""
+    out = np.empty((steps, 3))
+    x, y, z = x0, y0, z0
+    out[0, 0], out[0, 1], out[0, 2] = x, y, z
+    h, w = 0.5 * dt, dt / 6.0
+    for i in range(1, steps):
+        k1x, k1y, k1z = thomas(x, y, z, b)
+        k2x, k2y, k2z = thomas(x + h * k1x, y + h * k1y, z + h * k1z, b)
+        k3x, k3y, k3z = thomas(x + h * k2x, y + h * k2y, z + h * k2z, b)
+        k4x, k4y, k4z = thomas(x + dt * k3x, y + dt * k3y, z + dt * k3z, b)
+        x += w * (k1x + 2 * k2x + 2 * k3x + k4x)
+        y += w * (k1y + 2 * k2y + 2 * k3y + k4y)
+        z += w * (k1z + 2 * k2z + 2 * k3z + k4z)
+        out[i, 0], out[i, 1], out[i, 2] = x, y, z
+    return out
+
+
+@njit(cache=True)
+def integrate_aizawa(x0, y0, z0, dt, steps, a, b, c, d, e, f):
+    """RK4-integrate the Aizawa system with scalar state (JIT-compiled)."""
+    out = np.empty((steps, 3))
+    x, y, z = x0, y0, z0
+    out[0, 0], out[0, 1], out[0, 2] = x, y, z
+    h, w = 0.5 * dt, dt / 6.0
+    for i in range(1, steps):
+        k1x, k1y, k1z = aizawa(x, y, z, a, b, c, d, e, f)
+        k2x, k2y, k2z = aizawa(x + h * k1x, y + h * k1y, z + h * k1z, a, b, c, d, e, f)
+        k3x, k3y, k3z = aizawa(x + h * k2x, y + h * k2y, z + h * k2z, a, b, c, d, e, f)
+        k4x, k4y, k4z = aizawa(x + dt * k3x, y + dt * k3y, z + dt * k3z, a, b, c, d, e, f)
+        x += w * (k1x + 2 * k2x + 2 * k3x + k4x)
+        y += w * (k1y + 2 * k2y + 2 * k3y + k4y)
+        z += w * (k1z + 2 * k2z + 2 * k3z + k4z)
+        out[i, 0], out[i, 1], out[i, 2] = x, y, z
+    return out
+
+
+JIT_INTEGRATORS = {
+    "Lorenz": integrate_lorenz,
+    "Rossler": integrate_rossler,
+    "Thomas": integrate_thomas,
+    "Aizawa": integrate_aizawa,
+}
+
+# Cython counterparts, used when Numba is unavailable but _rk4core is built
+CYTHON_INTEGRATORS = {
+    name: getattr(_rk4core, kernel.__name__) for name, kernel in JIT_INTEGRATORS.items()
+} if HAVE_CYTHON_CORE else {}
+
+
+# Parallel ensemble drivers: independent trajectories are spread across CPU
+# cores with prange, each running the single-trajectory kernel above.
+
+@njit(parallel=True, cache=True)
+def integrate_many_lorenz(inits, dt, steps, sigma, rho, beta):
+    """RK4-integrate a batch of Lorenz trajectories in parallel (JIT-compiled)."""
+    out = np.empty((inits.shape[0], steps, 3))
+    for i in prange(inits.shape[0]):
+        out[i] = integrate_lorenz(inits[i, 0], inits[i, 1], inits[i, 2], dt, steps, sigma, rho, beta)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def integrate_many_rossler(inits, dt, steps, a, b, c):
+    """RK4-integrate a batch of Rössler trajectories in parallel (JIT-compiled)."""
+    out = np.empty((inits.shape[0], steps, 3))
+    for i in prange(inits.shape[0]):
+        out[i] = integrate_rossler(inits[i, 0], inits[i, 1], inits[i, 2], dt, steps, a, b, c)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def integrate_many_thomas(inits, dt, steps, b):
+    """RK4-integrate a batch of Thomas trajectories in parallel (JIT-compiled)."""
+    out = np.empty((inits.shape[0], steps, 3))
+    for i in prange(inits.shape[0]):
+        out[i] = integrate_thomas(inits[i, 0], inits[i, 1], inits[i, 2], dt, steps, b)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def integrate_many_aizawa(inits, dt, steps, a, b, c, d, e, f):
+    """RK4-integrate a batch of Aizawa trajectories in parallel (JIT-compiled)."""
+    out = np.empty((inits.shape[0], steps, 3))
+    for i in prange(inits.shape[0]):
+        out[i] = integrate_aizawa(inits[i, 0], inits[i, 1], inits[i, 2], dt, steps, a, b, c, d, e, f)
+    return out
+
+
+ENSEMBLE_INTEGRATORS = {
+    "Lorenz": integrate_many_lorenz,
+    "Rossler": integrate_many_rossler,
+    "Thomas": integrate_many_thomas,
+    "Aizawa": integrate_many_aizawa,
+}
+
+
+def integrate(attractor_name, initial, params, dt, steps):
+    """Integrate a named attractor using its specialized RK4 kernel.
+
+    Dispatches to the JIT-compiled driver in JIT_INTEGRATORS, unpacking the
+    parameter dictionary into positional scalars in the order defined by
+    ATTRACTORS. Without Numba the Cython kernels in CYTHON_INTEGRATORS are
+    used if the extension is built, else the generated stepper from
+    make_stepper. Falls back to the generic rk4_integrate for attractors
+    without a dedicated kernel.
+
+    Args:
+        attractor_name: Key into ATTRACTORS
+        initial: Initial state [x0, y0, z0]
+        params: Dictionary of parameters for the attractor
+        dt: Time step size
+        steps: Number of integration steps to compute
+
+    Returns:
+        Numpy array of shape (steps, 3) containing the trajectory
+
+    Raises:
+        ValueError: If steps is less than 1
+
+    Performance:
+        The first call per attractor pays the Numba compile cost; cache=True
+        persists the compiled code across runs.
+    """
+    _check_steps(steps)
+    kernel = JIT_INTEGRATORS.get(attractor_name)
+    args = param_values(attractor_name, params)
+    if kernel is None:
+        return rk4_integrate(ATTRACTORS[attractor_name]["deriv"], np.asarray(initial, dtype=float),
+                             params, dt, steps)
+    x0, y0, z0 = (float(v) for v in initial)
+    if not HAVE_NUMBA:
+        if attractor_name in CYTHON_INTEGRATORS:
+            out = np.empty((steps, 3))
+            CYTHON_INTEGRATORS[attractor_name](x0, y0, z0, float(dt), int(steps), *args, out)
+            return out
+        # As plain Python the generated stepper is fastest: stages are inlined
+        # and Thomas uses math.sin instead of a ufunc call per scalar
+        return integrate_specialized(attractor_name, initial, params, dt, steps)
+    return kernel(x0, y0, z0, float(dt), int(steps), *args)
+
+
+def integrate_many(attractor_name, inits, params, dt, steps):
+    """Integrate a batch of independent trajectories of a named attractor.
+
+    Large batches run on the GPU when CUDA is available (see
+    integrate_many_cuda). Otherwise, with Numba the trajectories run in
+    parallel across CPU cores, and without it they fall back to the
+    vectorized NumPy integrate_batch.
+
+    Args:
+        attractor_name: Key into ATTRACTORS
+        inits: Initial states, array-like of shape (B, 3)
+        params: Dictionary of parameters for the attractor
+        dt: Time step size
+        steps: Number of integration steps to compute
+
+    Returns:
+        Numpy array of shape (B, steps, 3) containing all trajectories
+
+    Raises:
+        ValueError: If steps is less than 1
+    """
+    _check_steps(steps)
+    inits = np.ascontiguousarray(inits, dtype=float).reshape(-1, 3)
+    if HAVE_CUDA and len(inits) >= CUDA_MIN_BATCH:
+        return integrate_many_cuda(attractor_name, inits, params, dt, steps)
+    kernel = ENSEMBLE_INTEGRATORS.get(attractor_name)
+    args = param_values(attractor_name, params)
+    if not HAVE_NUMBA or kernel is None:
+        data = integrate_batch(ATTRACTORS[attractor_name]["deriv"], inits, params, dt, steps)
+        return data.transpose(1, 0, 2).copy()
+    return kernel(inits, float(dt), int(steps), *args)
+
+
+def integrate_adaptive(attractor_name, initial, params, dt, steps, method="DOP853",
+                       rtol=1e-8, atol=1e-10):
+    """Integrate a named attractor with SciPy's adaptive solve_ivp.
+
+    The solver picks its own internal step sizes; the result is sampled at
+    the same output times as the fixed-step integrators (t = i * dt), so it
+    can be used as a drop-in replacement for integrate().
+
+    Args:
+        attractor_name: Key into ATTRACTORS
+        initial: Initial state [x0, y0, z0]
+        params: Dictionary of parameters for the attractor
+        dt: Spacing of the output samples
+        steps: Number of output samples
+        method: solve_ivp method name (default: DOP853)
+        rtol: Relative tolerance
+        atol: Absolute tolerance
+
+    Returns:
+        Numpy array of shape (steps, 3) containing the trajectory
+
+    Raises:
+        ValueError: If steps is less than 1
+        RuntimeError: If SciPy is unavailable or the solver fails
+    """
+    _check_steps(steps)
+    if steps == 1:
+        # solve_ivp rejects an empty time span; the one sample is the start
+        return np.asarray(initial, dtype=float).reshape(1, 3)
+    if not HAVE_SCIPY:
+        raise RuntimeError("Adaptive integration requires SciPy. Install with: pip install scipy")
+    from scipy.integrate import solve_ivp
+
+    deriv = ATTRACTORS[attractor_name]["make_deriv"](params)
+    t_eval = np.arange(steps) * dt
+    # solve_ivp calls back into Python for every RHS evaluation; unpacking the
+    # state with tolist() hands the derivative plain floats, whose arithmetic
+    # is much cheaper than on NumPy scalars
+    sol = solve_ivp(lambda t, s: deriv(*s.tolist()), (0.0, t_eval[-1]),
+                    np.asarray(initial, dtype=float), method=method, t_eval=t_eval,
+                    rtol=rtol, atol=atol)
+    if not sol.success:
+        raise RuntimeError(f"Adaptive integration failed: {sol.message}")
+    return sol.y.T
+
+
+# Integrators selectable in Plot Settings, with a description for the UI.
+# The first three run on the JIT kernels; the rest are solve_ivp methods and
+# need SciPy.
+SOLVERS = {
+    "RK4": "Classical Runge-Kutta, fixed dt",
+    "Tsit5": "Tsitouras 5(4), fixed dt",
+    "Tsit5-adaptive": "Tsitouras 5(4), adaptive, compiled",
+    "RK45": "Dormand-Prince 5(4), adaptive",
+    "DOP853": "Dormand-Prince 8(5,3), adaptive",
+    "LSODA": "Adams/BDF with stiffness detection, adaptive",
+}
+SCIPY_SOLVERS = ("RK45", "DOP853", "LSODA")
+# Solvers whose output depends only on the current state, so a run continued
+# from its last state is bit-identical to one long run
+FIXED_STEP_SOLVERS = ("RK4", "Tsit5")
+
+
+def integrate_with(solver, attractor_name, initial, params, dt, steps, rtol=1e-8):
+    """Integrate a named attractor with one of the SOLVERS.
+
+    Args:
+        solver: Key into SOLVERS
+        attractor_name: Key into ATTRACTORS
+        initial: Initial state [x0, y0, z0]
+        params: Dictionary of parameters for the attractor
+        dt: Time step size (output spacing for the adaptive solvers)
+        steps: Number of integration steps to compute
+        rtol: Relative tolerance of the adaptive solvers; ignored by the
+            fixed-step ones
+
+    Returns:
+        Numpy array of shape (steps, 3) containing the trajectory
+
+    Raises:
+        ValueError: If the solver is unknown or steps is less than 1
+    """
+    _check_steps(steps)
+    if solver == "RK4":
+        return integrate(attractor_name, initial, params, dt, steps)
+    if solver == "Tsit5":
+        return integrate_tsit5(attractor_name, initial, params, dt, steps)
+    if solver == "Tsit5-adaptive":
+        return integrate_tsit5_adaptive(attractor_name, initial, params, dt, steps, rtol=rtol)
+    if solver not in SOLVERS:
+        raise ValueError(f"Unknown solver {solver!r}")
+    return integrate_adaptive(attractor_name, initial, params, dt, steps, method=solver, rtol=rtol)
+
+
+@njit(cache=True)
+def _bounds_kernel(data):
+    """Per-column min and max of an (N, 3) array in one traversal (JIT-compiled)."""
+    mins = data[0].copy()
+    maxs = data[0].copy()
+    for i in range(1, data.shape[0]):
+        for j in range(3):
+            v = data[i, j]
+            if v < mins[j]:
+                mins[j] = v
+            elif v > maxs[j]:
+                maxs[j] = v
+    return mins, maxs
+
+
+def data_bounds(data):
+    """Return the per-axis minimum and maximum of a trajectory.
+
+    With Numba both are found in a single pass over the data instead of one
+    pass per reduction, halving the memory traffic on large arrays.
+
+    Args:
+        data: Numpy array of shape (N, 3), N >= 1
+
+    Returns:
+        Tuple (mins, maxs) of length-3 arrays
+    """
+    if HAVE_NUMBA:
+        return _bounds_kernel(np.ascontiguousarray(data))
+    return data.min(axis=0), data.max(axis=0)
+
+
+# Runtime-specialized RK4 steppers.
+#
+# For a fixed attractor and parameter set, Python source is generated with the
+# parameters as literal constants and all four RK4 stages inlined over scalars,
+# then compiled with Numba. The compiler can then fold and reorder across
+# stages, and the stepping loop makes no function calls at all. Compiled
+# steppers are kept per (attractor, parameters) so revisiting a setting is free.
+
+_SPECIALIZED_STEPPERS = {}
+_MAX_SPECIALIZED_STEPPERS = 32
+_FUSABLE = {}  # attractor name -> whether emit_fused_stepper fuses its rhs
+
+
+def emit_stepper(attractor_name, params):
+    """Generate source code for an inlined RK4 stepper with baked-in parameters.
+
+    The source defines step(x0, y0, z0, dt) returning the next state, and
+    run(x, y, z, dt, out) that fills each row of out with successive states
+    and returns the final state.
+
+    Args:
+        attractor_name: Key into ATTRACTORS
+        params: Dictionary of parameters for the attractor
+
+    Returns:
+        Python source code as a string
+
+    Raises:
+        ValueError: If a parameter is not a finite number
+    """
+    attractor = ATTRACTORS[attractor_name]
+    fx, fy, fz = attractor["rhs"]
+    lines = ["def step(x0, y0, z0, dt):"]
+    for pname in attractor["params"]:
+        value = float(params[pname])
+        if not math.isfinite(value):
+            raise ValueError(f"Parameter {pname} must be finite, got {value}")
+        lines.append(f"    {pname} = {value!r}")
+    lines.append("    h = 0.5 * dt")
+    # Each stage rebinds x, y, z to its evaluation point so the right-hand
+    # side expressions can be pasted in unchanged
+    stage_points = ["x0, y0, z0",
+                    "x0 + h * k1x, y0 + h * k1y, z0 + h * k1z",
+                    "x0 + h * k2x, y0 + h * k2y, z0 + h * k2z",
+                    "x0 + dt * k3x, y0 + dt * k3y, z0 + dt * k3z"]
+    for stage, point in enumerate(stage_points, start=1):
+        lines.append(f"    x, y, z = {point}")
+        lines.append(f"    k{stage}x = {fx}")
+        lines.append(f"    k{stage}y = {fy}")
+        lines.append(f"    k{stage}z = {fz}")
+    lines.append("    w = dt / 6.0")
+    lines.append("    return (x0 + w * (k1x + 2.0 * k2x + 2.0 * k3x + k4x),")
+    lines.append("            y0 + w * (k1y + 2.0 * k2y + 2.0 * k3y + k4y),")
+    lines.append("            z0 + w * (k1z + 2.0 * k2z + 2.0 * k3z + k4z))")
+    lines.append("")
+    lines.append("")
+    lines.append("def run(x, y, z, dt, out):")
+    lines.append("    for i in range(out.shape[0]):")
+    lines.append("        x, y, z = step(x, y, z, dt)")
+    lines.append("        out[i, 0] = x")
+    lines.append("        out[i, 1] = y")
+    lines.append("        out[i, 2] = z")
+    lines.append("    return x, y, z")
+    return "\n".join(lines) + "\n"
+
+
+def emit_fused_stepper(attractor_name, params, dt):
+    """Generate source for a closed-form RK4 step with parameters and dt baked in.
+
+    SymPy substitutes the right-hand side into all four RK4 stages, folds the
+    constants (dt/6, 0.5*dt, parameter products) and extracts common
+    subexpressions, so the step is one straight-line update of (x, y, z) with
+    no k1..k4 temporaries. The source defines step and run with the same
+    signatures as emit_stepper; their dt argument is ignored.
+
+    Args:
+        attractor_name: Key into ATTRACTORS
+        params: Dictionary of parameters for the attractor
+        dt: Time step size to bake in
+
+    Returns:
+        Python source code as a string, or None if the right-hand side is
+        not polynomial (fusing sin() terms makes the step slower, not faster)
+
+    Raises:
+        ValueError: If a parameter or dt is not a finite number
+    """
+    import sympy
+    from sympy.printing.precedence import PRECEDENCE
+    from sympy.printing.pycode import PythonCodePrinter
+
+    class ProductPrinter(PythonCodePrinter):
+        """Prints small integer powers as products: x**3 becomes x*x*x.
+
+        float.__pow__ is several times slower than multiplying when the
+        source runs as plain Python, and Numba emits a pow() call for it.
+        """
+
+        def _print_Pow(self, expr, rational=False):
+            if expr.exp.is_Integer and 2 <= expr.exp <= 4:
+                return "*".join([self.parenthesize(expr.base, PRECEDENCE["Mul"])] * int(expr.exp))
+            return super()._print_Pow(expr, rational=rational)
+
+    attractor = ATTRACTORS[attractor_name]
+    x, y, z = sympy.symbols("x y z")
+    x0, y0, z0 = sympy.symbols("x0 y0 z0")
+    namespace = {"x": x, "y": y, "z": z}
+    for pname in attractor["params"]:
+        value = float(params[pname])
+        if not math.isfinite(value):
+            raise ValueError(f"Parameter {pname} must be finite, got {value}")
+        namespace[pname] = sympy.Float(value, 17)
+    dt = float(dt)
+    if not math.isfinite(dt):
+        raise ValueError(f"dt must be finite, got {dt}")
+
+    rhs = [sympy.sympify(expr, locals=namespace) for expr in attractor["rhs"]]
+    if not all(f.is_polynomial(x, y, z) for f in rhs):
+        return None
+
+    def f(point):
+        return [g.xreplace(dict(zip((x, y, z), point))) for g in rhs]
+
+    h = sympy.Float(dt, 17)
+    state = (x0, y0, z0)
+    k1 = f(state)
+    k2 = f([s + h / 2 * k for s, k in zip(state, k1)])
+    k3 = f([s + h / 2 * k for s, k in zip(state, k2)])
+    k4 = f([s + h * k for s, k in zip(state, k3)])
+    update = [s + h / 6 * (a + 2 * b + 2 * c + d) for s, a, b, c, d in zip(state, k1, k2, k3, k4)]
+    temporaries, (nx, ny, nz) = sympy.cse(update, symbols=sympy.numbered_symbols("t"))
+
+    pycode = ProductPrinter().doprint
+    lines = ["def step(x0, y0, z0, dt):"]
+    for name, expr in temporaries:
+        lines.append(f"    {name} = {pycode(expr)}")
+    lines.append(f"    return ({pycode(nx)},")
+    lines.append(f"            {pycode(ny)},")
+    lines.append(f"            {pycode(nz)})")
+    lines.append("")
+    lines.append("")
+    lines.append("def run(x, y, z, dt, out):")
+    lines.append("    for i in range(out.shape[0]):")
+    lines.append("        x, y, z = step(x, y, z, dt)")
+    lines.append("        out[i, 0] = x")
+    lines.append("        out[i, 1] = y")
+    lines.append("        out[i, 2] = z")
+    lines.append("    return x, y, z")
+    return "\n".join(lines) + "\n"
+
+
+def _fusable(attractor_name):
+    """Whether emit_fused_stepper produces a stepper, i.e. the rhs is polynomial."""
+    fusable = _FUSABLE.get(attractor_name)
+    if fusable is None:
+        import sympy
+
+        attractor = ATTRACTORS[attractor_name]
+        x, y, z = sympy.symbols("x y z")
+        namespace = {"x": x, "y": y, "z": z}
+        namespace.update((pname, sympy.Symbol(pname)) for pname in attractor["params"])
+        fusable = _FUSABLE[attractor_name] = all(
+            sympy.sympify(expr, locals=namespace).is_polynomial(x, y, z) for expr in attractor["rhs"])
+    return fusable
+
+
+def make_stepper(attractor_name, params, dt=None):
+    """Compile (or fetch from cache) the specialized stepper for a parameter set.
+
+    Args:
+        attractor_name: Key into ATTRACTORS
+        params: Dictionary of parameters for the attractor
+        dt: Optional time step to specialize for as well. With SymPy installed
+            and a polynomial right-hand side, the closed-form stepper from
+            emit_fused_stepper is used and later dt arguments are ignored.
+
+    Returns:
+        Tuple (step, run) of the compiled functions described in emit_stepper
+
+    Performance:
+        The first call for a parameter set pays a Numba compile (a few hundred
+        ms, not persisted across runs); later calls hit the in-memory cache.
+        The fused steppers run about 20% faster on Lorenz, Rossler and Aizawa.
+    """
+    # dt is only part of the key when it is compiled in; a non-polynomial rhs
+    # gets one generic stepper shared by every dt
+    if not HAVE_SYMPY or not _fusable(attractor_name):
+        dt = None
+    key = (attractor_name, param_values(attractor_name, params),
+           None if dt is None else float(dt))
+    cached = _SPECIALIZED_STEPPERS.get(key)
+    if cached is not None:
+        return cached
+
+    source = None if dt is None else emit_fused_stepper(attractor_name, params, dt)
+    if source is None:
+        source = emit_stepper(attractor_name, params)
+    namespace = {"sin": math.sin}
+    exec(compile(source, f"<rk4 stepper: {attractor_name}>", "exec"), namespace)
+    # run() resolves step through the namespace, so it sees the compiled version
+    namespace["step"] = njit(namespace["step"])
+    namespace["run"] = njit(namespace["run"])
+
+    if len(_SPECIALIZED_STEPPERS) >= _MAX_SPECIALIZED_STEPPERS:
+        _SPECIALIZED_STEPPERS.clear()
+    stepper = (namespace["step"], namespace["run"])
+    _SPECIALIZED_STEPPERS[key] = stepper
+    return stepper
+
+
+def integrate_specialized(attractor_name, initial, params, dt, steps):
+    """Integrate a named attractor with its runtime-specialized RK4 stepper.
+
+    Args:
+        attractor_name: Key into ATTRACTORS
+        initial: Initial state [x0, y0, z0]
+        params: Dictionary of parameters for the attractor
+        dt: Time step size
+        steps: Number of integration steps to compute
+
+    Returns:
+        Numpy array of shape (steps, 3) containing the trajectory
+
+    Raises:
+        ValueError: If steps is less than 1
+    """
+    _check_steps(steps)
+    _, run = make_stepper(attractor_name, params, dt)
+    out = np.empty((steps, 3))
+    x0, y0, z0 = (float(v) for v in initial)
+    out[0] = x0, y0, z0
+    run(x0, y0, z0, float(dt), out[1:])
+    return out
+
+
+_CUDA_KERNELS = {}
+_CUDA_THREADS_PER_BLOCK = 256
+
+
+def make_cuda_kernel(attractor_name, params, dt=None):
+    """Compile (or fetch from cache) a CUDA batch kernel for a parameter set.
+
+    The kernel runs one trajectory per GPU thread, keeping the state in
+    registers. Its RK4 step is the generated stepper from emit_stepper,
+    compiled as a device function, so the parameters are constants on the
+    device as well. As in make_stepper, passing dt selects the closed-form
+    stepper from emit_fused_stepper when SymPy is available, which also
+    needs fewer registers per thread.
+
+    Args:
+        attractor_name: Key into ATTRACTORS
+        params: Dictionary of parameters for the attractor
+        dt: Optional time step to specialize for as well
+
+    Returns:
+        CUDA kernel taking (inits, dt, steps, stride, out)
+    """
+    # dt is only part of the key when it is compiled in; a non-polynomial rhs
+    # gets one generic stepper shared by every dt
+    if not HAVE_SYMPY or not _fusable(attractor_name):
+        dt = None
+    key = (attractor_name, param_values(attractor_name, params),
+           None if dt is None else float(dt))
+    kernel = _CUDA_KERNELS.get(key)
+    if kernel is not None:
+        return kernel
+
+    source = None if dt is None else emit_fused_stepper(attractor_name, params, dt)
+    if source is None:
+        source = emit_stepper(attractor_name, params)
+    namespace = {"sin": math.sin}
+    exec(compile(source, f"<cuda stepper: {attractor_name}>", "exec"), namespace)
+    step = cuda.jit(device=True)(namespace["step"])
+
+    @cuda.jit
+    def kernel(inits, dt, steps, stride, out):
+        i = cuda.grid(1)
+        if i >= inits.shape[0]:
+            return
+        x, y, z = inits[i, 0], inits[i, 1], inits[i, 2]
+        for k in range(steps):
+            # Only every stride-th state is written back to global memory
+            if k % stride == 0:
+                j = k // stride
+                out[i, j, 0] = x
+                out[i, j, 1] = y
+                out[i, j, 2] = z
+            x, y, z = step(x, y, z, dt)
+
+    if len(_CUDA_KERNELS) >= _MAX_SPECIALIZED_STEPPERS:
+        _CUDA_KERNELS.clear()
+    _CUDA_KERNELS[key] = kernel
+    return kernel
+
+
+def integrate_many_cuda(attractor_name, inits, params, dt, steps, stride=1):
+    """Integrate a batch of trajectories on the GPU, one thread per trajectory.
+
+    Args:
+        attractor_name: Key into ATTRACTORS
+        inits: Initial states, array-like of shape (B, 3)
+        params: Dictionary of parameters for the attractor
+        dt: Time step size
+        steps: Number of integration steps to compute
+        stride: Keep every stride-th state (reduces device-to-host transfer)
+
+    Returns:
+        Numpy array of shape (B, ceil(steps / stride), 3)
+
+    Raises:
+        ValueError: If steps is less than 1
+        RuntimeError: If no CUDA device is available
+    """
+    _check_steps(steps)
+    if not HAVE_CUDA:
+        raise RuntimeError("CUDA integration requires Numba and a CUDA-capable GPU")
+    kernel = make_cuda_kernel(attractor_name, params, dt)
+    inits = np.ascontiguousarray(inits, dtype=float).reshape(-1, 3)
+    d_inits = cuda.to_device(inits)
+    d_out = cuda.device_array((len(inits), -(-steps // stride), 3))
+    blocks = -(-len(inits) // _CUDA_THREADS_PER_BLOCK)
+    kernel[blocks, _CUDA_THREADS_PER_BLOCK](d_inits, float(dt), int(steps), int(stride), d_out)
+    return d_out.copy_to_host()
+
+
+def warm_up_kernels():
+    """Load or compile every JIT kernel ahead of its first real use.
+
+    Loading (or, on a cold cache, compiling) a Numba kernel happens on its
+    first call; a cold compile of all kernels takes several seconds. Doing it
+    up front keeps the delay off the first plot and batch run; SymPy is
+    imported here for the same reason. The parallel drivers are only
+    compiled, not run, but compiling them launches Numba's threading layer.
+    Before running this on a background thread, launch that layer on the
+    main thread (e.g. with numba.set_num_threads): a TBB layer first launched
+    from another thread hangs the interpreter at exit.
+    """
+    for name, attractor in ATTRACTORS.items():
+        data = integrate(name, attractor["init"], attractor["params"], 0.01, 2)
+        kernel = ENSEMBLE_INTEGRATORS.get(name)
+        if HAVE_NUMBA and kernel is not None:
+            inits = np.tile(np.asarray(attractor["init"], dtype=float), (2, 1))
+            args = (inits, 0.01, 2) + param_values(name, attractor["params"])
+            kernel.compile(tuple(typeof(arg) for arg in args))
+    # Plots are bounded in float32, animation samples in float64
+    data_bounds(data)
+    data_bounds(data.astype(np.float32))
+    if HAVE_SYMPY:
+        # Imported lazily by emit_fused_stepper; pay for it here instead of
+        # on the first animation start
+        import sympy  # noqa: F401
@@ -1,16 +1,31 @@
 """Enhanced Qt GUI for exploring classic chaotic attractors in 3D."""
 
+import os
 import sys
+import math
 import time
+import threading
 import logging
+from collections import OrderedDict
+from importlib.util import find_spec
 from pathlib import Path
 import numpy as np
 import psutil
+
+from attractor_core import (
+    ATTRACTORS, SOLVERS, SCIPY_SOLVERS, FIXED_STEP_SOLVERS, HAVE_NUMBA, HAVE_SCIPY,
+    integrate, integrate_many, integrate_with, make_stepper, data_bounds, warm_up_kernels,
+)
+# Re-exported for scripts that import the integrators from this module
+from attractor_core import lorenz, rossler, thomas, aizawa, rk4_integrate  # noqa: F401
+
 import matplotlib
 matplotlib.use('QtAgg')
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolbar2QT
 from matplotlib.figure import Figure
+from matplotlib.colors import to_rgba
+from matplotlib.ticker import MaxNLocator
 
 try:
     from PyQt6 import QtWidgets, QtCore, QtGui
@@ -21,6 +36,10 @@ except ImportError:
     print("ERROR: PyQt6 is required. Install with: pip install PyQt6")
     sys.exit(1)
 
+# Optional GPU-rendered plot view. pyqtgraph.opengl takes about 0.3 s to
+# import, so it is only imported when the view is first shown
+HAVE_PYQTGRAPH = find_spec("pyqtgraph") is not None and find_spec("OpenGL") is not None
+
 # Configure logging to file
 log_dir = Path(__file__).parent / "logs"
 log_dir.mkdir(exist_ok=True)
@@ -33,175 +52,71 @@ logging.basicConfig(
     ]
 )
 logger = logging.getLogger(__name__)
+# Numba logs its compiler passes at DEBUG level; keep them out of our log
+logging.getLogger("numba").setLevel(logging.WARNING)
 
+# Upper bound on points handed to matplotlib for a static plot; beyond this
+# extra points overlap on screen and only slow down projection and rendering
+MAX_RENDER_POINTS = 20000
 
-def lorenz(state, p):
-    """Compute derivatives for the Lorenz attractor system.
+# The same bound for the OpenGL view, which projects and rasterizes on the GPU
+# and stays interactive with far more points
+MAX_GL_RENDER_POINTS = 1000000
 
-    Args:
-        state: Current state [x, y, z]
-        p: Parameter dictionary with keys: sigma, rho, beta
+# Upper bound on markers in the static scatter overlay; the line already shows
+# every rendered point, and markers cost far more to draw than line segments
+MAX_SCATTER_POINTS = 5000
 
-    Returns:
-        Array of derivatives [dx/dt, dy/dt, dz/dt]
-    """
-    x, y, z = state
-    dx = p["sigma"] * (y - x)
-    dy = x * (p["rho"] - z) - y
-    dz = x * y - p["beta"] * z
-    return np.array([dx, dy, dz], dtype=float)
+# Standard deviation of the random perturbation applied to the initial state
+# of each extra trajectory in a batch run
+BATCH_JITTER = 1e-3
 
+# Consecutive over-budget animation frames before the animation starts
+# integrating extra steps per frame to keep simulated time running in real time
+ANIMATION_LAG_FRAMES = 3
 
-def rossler(state, p):
-    """Compute derivatives for the Rössler attractor system.
+# Degrees the auto-rotating animation view turns at a time; it advances 0.5
+# degrees per frame, so every other frame reuses the last rendered view
+ANIMATION_ROTATE_STEP = 1.0
 
-    Args:
-        state: Current state [x, y, z]
-        p: Parameter dictionary with keys: a, b, c
+# Smoothing factor of the moving average of animation frame cost that sets
+# the timer interval, and the change (ms) needed before the timer is re-armed
+ANIMATION_COST_SMOOTHING = 0.1
+ANIMATION_INTERVAL_SLACK_MS = 2
 
-    Returns:
-        Array of derivatives [dx/dt, dy/dt, dz/dt]
-    """
-    x, y, z = state
-    dx = -y - z
-    dy = x + p["a"] * y
-    dz = p["b"] + z * (x - p["c"])
-    return np.array([dx, dy, dz], dtype=float)
+# Number of recent integration results kept so switching back to an earlier
+# attractor or parameter set redraws without integrating again
+TRAJECTORY_CACHE_SIZE = 4
 
+# Minimum seconds between memory readings for the stats overlay; redraws in
+# between reuse the last reading instead of querying the OS again
+STATS_MEMORY_INTERVAL = 0.5
 
-def thomas(state, p):
-    """Compute derivatives for the Thomas attractor system.
+# Period (ms) of the stats overlay refresh while an animation is running;
+# frames themselves never touch the overlay
+STATS_REFRESH_MS = 500
 
-    Args:
-        state: Current state [x, y, z]
-        p: Parameter dictionary with key: b
+# Quiet period (ms) after the last keystroke in the animation steps field
+# before the progress label is relaid out for the new total
+STEPS_EDIT_DEBOUNCE_MS = 200
 
-    Returns:
-        Array of derivatives [dx/dt, dy/dt, dz/dt]
-    """
-    x, y, z = state
-    b = p["b"]
-    dx = np.sin(y) - b * x
-    dy = np.sin(z) - b * y
-    dz = np.sin(x) - b * z
-    return np.array([dx, dy, dz], dtype=float)
-
-
-def aizawa(state, p):
-    """Compute derivatives for the Aizawa attractor system.
 
-    Args:
-        state: Current state [x, y, z]
-        p: Parameter dictionary with keys: a, b, c, d, e, f
+def _launch_numba_threads():
+    """Size Numba's thread pool and start its threading layer.
 
-    Returns:
-        Array of derivatives [dx/dt, dy/dt, dz/dt]
+    The parallel drivers are FP-bound, and SMT siblings share the FP units,
+    so the pool gets one thread per physical core unless the user chose a
+    count with NUMBA_NUM_THREADS. Must run on the main thread before the
+    warm-up thread starts: warm_up_kernels only compiles the parallel
+    drivers, but compiling one launches Numba's threading layer, and a TBB
+    layer launched from another thread hangs the interpreter at exit.
     """
-    x, y, z = state
-    dx = (z - p["b"]) * x - p["d"] * y
-    dy = p["d"] * x + (z - p["b"]) * y
-    dz = p["c"] + p["a"] * z - (z ** 3) / 3 - (x ** 2 + y ** 2) * (1 + p["e"] * z) + p["f"] * z * (x ** 3)
-    return np.array([dx, dy, dz], dtype=float)
-
-
-ATTRACTORS = {
-    "Lorenz": {
-        "deriv": lorenz,
-        "params": {"sigma": 10.0, "rho": 28.0, "beta": 8.0 / 3.0},
-        "init": [0.1, 0.0, 0.0],
-        "equations": [
-            "dx/dt = σ(y - x)",
-            "dy/dt = x(ρ - z) - y",
-            "dz/dt = xy - βz"
-        ],
-        "description": "The Lorenz attractor is a set of chaotic solutions to the Lorenz system, discovered by Edward Lorenz in 1963. It represents a simplified model of atmospheric convection and is one of the most iconic examples of chaos theory. The system exhibits sensitive dependence on initial conditions - the famous 'butterfly effect'. The attractor has a distinctive butterfly or figure-8 shape with two lobes.",
-        "tooltips": {
-            "sigma": "Prandtl number - ratio of momentum to thermal diffusivity",
-            "rho": "Rayleigh number - temperature difference driving convection",
-            "beta": "Geometric factor related to physical dimensions"
-        }
-    },
-    "Rossler": {
-        "deriv": rossler,
-        "params": {"a": 0.2, "b": 0.2, "c": 5.7},
-        "init": [0.0, 1.0, 0.0],
-        "equations": [
-            "dx/dt = -y - z",
-            "dy/dt = x + ay",
-            "dz/dt = b + z(x - c)"
-        ],
-        "description": "The Rössler attractor, discovered by Otto Rössler in 1976, is a system of three nonlinear ordinary differential equations that exhibit chaotic behavior. It was originally designed to be simpler than the Lorenz attractor while still displaying continuous chaos. The attractor produces a characteristic spiral pattern that folds back on itself, creating a band-like structure in phase space.",
-        "tooltips": {
-            "a": "Controls rate of rotation in xy-plane",
-            "b": "Linear term in z equation",
-            "c": "Controls z-height of rotation center"
-        }
-    },
-    "Thomas": {
-        "deriv": thomas,
-        "params": {"b": 0.208186},
-        "init": [0.1, 0.0, 0.0],
-        "equations": [
-            "dx/dt = sin(y) - bx",
-            "dy/dt = sin(z) - by",
-            "dz/dt = sin(x) - bz"
-        ],
-        "description": "The Thomas attractor is a cyclically symmetric chaotic system discovered by René Thomas. It features time-reversal symmetry and exhibits a smooth flowing pattern. The attractor is characterized by its elegant, intertwined looping structure that demonstrates conservative chaos. The parameter b controls the damping, with the standard value of ~0.208186 producing particularly aesthetic trajectories.",
-        "tooltips": {
-            "b": "Damping parameter - controls dissipation rate"
-        }
-    },
-    "Aizawa": {
-        "deriv": aizawa,
-        "params": {"a": 0.95, "b": 0.7, "c": 0.6, "d": 3.5, "e": 0.25, "f": 0.1},
-        "init": [0.1, 0.0, 0.0],
-        "equations": [
-            "dx/dt = (z - b)x - dy",
-            "dy/dt = dx + (z - b)y",
-            "dz/dt = c + az - z³/3 - (x² + y²)(1 + ez) + fz(x³)"
-        ],
-        "description": "The Aizawa attractor is a complex chaotic system with rich dynamic behavior. It produces intricate toroidal structures with multiple twisted bands. The system has six parameters that can be tuned to produce a variety of different attractor shapes, from simple limit cycles to highly complex strange attractors. The standard parameter set creates a distinctive multi-lobed structure.",
-        "tooltips": {
-            "a": "Linear z coefficient",
-            "b": "Shift parameter for x and y equations",
-            "c": "Constant term in z equation",
-            "d": "Coupling coefficient between x and y",
-            "e": "Nonlinear z coupling factor",
-            "f": "Cubic x coupling to z"
-        }
-    },
-}
-
-
-def rk4_integrate(deriv, initial, params, dt, steps):
-    """Integrate a chaotic system using 4th-order Runge-Kutta method.
-
-    This is the classical RK4 method, which provides high accuracy for
-    chaotic systems while being computationally efficient.
-
-    Args:
-        deriv: Derivative function that takes (state, params) and returns derivatives
-        initial: Initial state as numpy array [x0, y0, z0]
-        params: Dictionary of parameters for the derivative function
-        dt: Time step size (smaller = more accurate but slower)
-        steps: Number of integration steps to compute
-
-    Returns:
-        Numpy array of shape (steps, 3) containing the trajectory
-
-    Performance:
-        ~200ms for 20,000 steps on typical hardware
-    """
-    data = np.empty((steps, 3), dtype=float)
-    data[0] = initial
-    for i in range(1, steps):
-        state = data[i - 1]
-        k1 = deriv(state, params)
-        k2 = deriv(state + 0.5 * dt * k1, params)
-        k3 = deriv(state + 0.5 * dt * k2, params)
-        k4 = deriv(state + dt * k3, params)
-        data[i] = state + (dt / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
-    return data
+    from numba import config, get_num_threads, set_num_threads
+
+    cores = psutil.cpu_count(logical=False)
+    if "NUMBA_NUM_THREADS" in os.environ or not cores:
+        cores = get_num_threads()
+    set_num_threads(min(cores, config.NUMBA_NUM_THREADS))
 
 
 class AttractorWindow(QMainWindow):
@@ -226,6 +141,9 @@ class AttractorWindow(QMainWindow):
         - Helper methods to eliminate code duplication
     """
 
+    # Delivers _prepare_animation's (job, result) from its worker thread
+    animation_prepared = QtCore.pyqtSignal(object, object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Attractor Explorer (Qt Enhanced)")
@@ -233,6 +151,8 @@ class AttractorWindow(QMainWindow):
 
         self.data = None
         self.current_attractor = None
+        self._trajectories = None  # Full-resolution float32 (B, steps, 3) trajectories on display
+        self._trajectory_cache = OrderedDict()  # Inputs -> (trajectories, final states), least recently used first
         self.line_color = "#1f77b4"
         self.scatter_color = "#d62728"
         self.draw_line = True
@@ -246,10 +166,21 @@ class AttractorWindow(QMainWindow):
         self.steps = 20000
         self.dt = 0.01
         self.stride = 2
+        self.solver = "RK4"  # Key into SOLVERS
+        self.rtol = 1e-8  # Relative tolerance of the adaptive solvers
 
         # Performance tracking
         self.last_plot_time = 0
         self.stats_text = None
+        self._plot_line = None  # Persistent static-plot artists, see _redraw_plot
+        self._plot_scatter = None
+        self._plot_scatter_color = None
+        self._plot_data = None  # Data currently held by the static-plot artists
+        self._process = psutil.Process()  # Handle for the memory readout
+        self._memory_mb = 0.0
+        self._memory_sampled_at = 0.0
+        self._stats_timer = None  # Refreshes the overlay during animation
+        self._stats_frames = 0  # Animation frames drawn since the last stats update
         self.equations_text = None  # Equations overlay on plot
 
         # Animation state
@@ -259,7 +190,10 @@ class AttractorWindow(QMainWindow):
         self.animation_step = 0
         self.animation_data = None
         self.animation_state = None
+        self.animation_run = None  # Compiled stepper; fused ones have dt built in
+        self._animation_params = None  # Parameters animation_run was compiled for
         self.animation_scatter = None
+        self._animation_scatter_color = None  # Color animation_scatter was built with
         self.animation_speed = 30  # FPS
         self.steps_per_frame = 5
         self.animation_auto_rotate = False
@@ -268,10 +202,27 @@ class AttractorWindow(QMainWindow):
         self.animation_azim = -60
         self.animation_fixed_scale = True  # Fixed axis scaling during animation
         self.animation_axis_limits = None  # Stored axis limits
+        self._blit_background = None  # Cached canvas pixels for blitting
+        self.gl_rendering = False  # Plots and animation rendered with OpenGL instead of matplotlib
+        self.gl_view = None  # Created on first use
+        self._slow_frames = 0  # Consecutive frames slower than the requested FPS
+        self._frame_catch_up = 1  # Multiplier on steps_per_frame while frames lag
+        self._frame_cost = None  # Moving average of animate_step wall time (s)
+        self._fade_alphas = None  # Fade opacity ramp, reused while the trail length holds
+        self._animation_prep = None  # Token of the pending _prepare_animation job
+        self._resume_after_prep = False  # Restart the timer once a rebuilt stepper is ready
+        self.animation_prepared.connect(self._on_animation_prepared)
 
         self._build_ui()
         self._build_menus()
 
+        # Load the JIT kernels in the background rather than on first click;
+        # a cold compile takes seconds, and LLVM releases the GIL while it
+        # works, so the window stays responsive
+        if HAVE_NUMBA:
+            _launch_numba_threads()
+            threading.Thread(target=warm_up_kernels, name="warm-up", daemon=True).start()
+
     def _build_ui(self):
         """Build the main user interface.
 
@@ -306,6 +257,9 @@ class AttractorWindow(QMainWindow):
         self.params_group = QGroupBox("Parameters")
         self.params_layout = QFormLayout()
         self.param_fields = {}
+        # (label, field) widget pairs by parameter name, kept across
+        # attractor switches so rebuild_params can reuse them
+        self._field_pool = {}
         self.params_group.setLayout(self.params_layout)
         controls_layout.addWidget(self.params_group)
 
@@ -321,6 +275,22 @@ class AttractorWindow(QMainWindow):
         init_layout.addRow("x0:", self.x0_field)
         init_layout.addRow("y0:", self.y0_field)
         init_layout.addRow("z0:", self.z0_field)
+        self.batch_field = QLineEdit("1")
+        self.batch_field.setToolTip("Number of trajectories from slightly perturbed initial conditions, "
+                                    "integrated in parallel (1 = single trajectory)")
+        init_layout.addRow("Batch size:", self.batch_field)
+        trajectory_layout = QHBoxLayout()
+        self.trajectory_slider = QSlider(Qt.Orientation.Horizontal)
+        self.trajectory_slider.setMinimum(0)
+        self.trajectory_slider.setMaximum(0)
+        self.trajectory_slider.setEnabled(False)
+        self.trajectory_slider.setToolTip("Scroll through the trajectories of the last batch")
+        self.trajectory_slider.valueChanged.connect(self.select_trajectory)
+        trajectory_layout.addWidget(self.trajectory_slider)
+        self.trajectory_label = QLabel("1")
+        self.trajectory_label.setMinimumWidth(30)
+        trajectory_layout.addWidget(self.trajectory_label)
+        init_layout.addRow("Trajectory:", trajectory_layout)
         init_group.setLayout(init_layout)
         controls_layout.addWidget(init_group)
 
@@ -355,6 +325,9 @@ class AttractorWindow(QMainWindow):
         self.animation_steps_field = QLineEdit(str(self.steps))
         self.animation_steps_field.setToolTip("Total integration steps (synced with Plot Settings)")
         self.animation_steps_field.textChanged.connect(self.on_animation_steps_changed)
+        self._steps_label_debounce = QtCore.QTimer(self)
+        self._steps_label_debounce.setSingleShot(True)
+        self._steps_label_debounce.timeout.connect(self._update_progress_label)
         total_steps_layout.addWidget(self.animation_steps_field)
         animation_layout.addLayout(total_steps_layout)
 
@@ -468,7 +441,10 @@ class AttractorWindow(QMainWindow):
         # Set default zoom (10% closer than default)
         self.ax.dist = 10 * 0.9  # Default is 10, so 9 zooms in 10%
         self.canvas = FigureCanvasQTAgg(self.fig)
+        # Every full redraw refreshes the blit background (resize, rotate, toggles)
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
         self.toolbar = NavigationToolbar2QT(self.canvas, toolbar_container)
+        self.toolbar_container = toolbar_container
 
         # Add info button to toolbar
         self.info_btn = QPushButton("?")
@@ -480,7 +456,10 @@ class AttractorWindow(QMainWindow):
         toolbar_layout.addWidget(self.info_btn)
 
         plot_layout.addWidget(toolbar_container)
-        plot_layout.addWidget(self.canvas)
+        # The OpenGL view, when enabled, is added as a second page
+        self.plot_stack = QStackedWidget()
+        self.plot_stack.addWidget(self.canvas)
+        plot_layout.addWidget(self.plot_stack)
 
         # Status bar
         self.statusBar().showMessage("Ready")
@@ -493,7 +472,7 @@ class AttractorWindow(QMainWindow):
         self.rebuild_params()
         # Display equations at startup
         self.update_equations()
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def _build_menus(self):
         """Build the menu system.
@@ -501,7 +480,7 @@ class AttractorWindow(QMainWindow):
         Menus:
             File: Quit
             Settings: Colors, draw modes, grid, axis, dark mode, stats
-            View: Control panel toggle
+            View: Control panel toggle, OpenGL rendering
             Plot: Create, settings dialog, reset view
             About: Application info, license
         """
@@ -541,6 +520,8 @@ class AttractorWindow(QMainWindow):
 
         self.draw_scatter_action = QAction("Draw Scatter", self, checkable=True)
         self.draw_scatter_action.setChecked(self.draw_scatter)
+        self.draw_scatter_action.setToolTip(f"Overlay up to {MAX_SCATTER_POINTS:,} evenly spaced points "
+                                            "as flat markers without depth shading")
         self.draw_scatter_action.triggered.connect(self.toggle_draw_scatter)
         settings_menu.addAction(self.draw_scatter_action)
 
@@ -582,6 +563,13 @@ class AttractorWindow(QMainWindow):
         self.toggle_panel_action.triggered.connect(self.toggle_left_panel)
         view_menu.addAction(self.toggle_panel_action)
 
+        self.gl_rendering_action = QAction("GPU Rendering (OpenGL)", self, checkable=True)
+        self.gl_rendering_action.setChecked(self.gl_rendering)
+        self.gl_rendering_action.setEnabled(HAVE_PYQTGRAPH)
+        self.gl_rendering_action.setToolTip("Render plots and animation on the GPU (requires pyqtgraph and PyOpenGL)")
+        self.gl_rendering_action.triggered.connect(self.toggle_gl_rendering)
+        view_menu.addAction(self.gl_rendering_action)
+
         # Plot menu
         plot_menu = menubar.addMenu("Plot")
         create_action = QAction("Create Plot", self)
@@ -625,6 +613,7 @@ class AttractorWindow(QMainWindow):
         # Clear animation state when switching attractors
         if self.animation_running:
             self.pause_animation()
+        self._cancel_animation_prep()
         self.animation_state = None
         self.animation_data = None
         self.animation_scatter = None
@@ -634,26 +623,14 @@ class AttractorWindow(QMainWindow):
 
         # Clear the plot if in animation mode to remove old scatter
         if self.animation_mode:
-            # Clear equations text before clearing axis
-            if self.equations_text:
-                self.equations_text.remove()
-                self.equations_text = None
-
-            self.ax.clear()
-            self.ax.set_xlabel("x")
-            self.ax.set_ylabel("y")
-            self.ax.set_zlabel("z")
-
-            # Apply visual settings
-            self._apply_grid_settings()
-            self._apply_axis_settings()
-            self._apply_color_theme()
-            self._apply_tick_settings()
+            self._reset_axes()
 
             # Update equations for new attractor
             self.update_equations()
 
-            self.canvas.draw()
+            self.canvas.draw_idle()
+            if self.gl_view is not None:
+                self.gl_trail.setData(pos=np.empty((0, 3), dtype=np.float32))
 
         self.rebuild_params()
         if should_replot:
@@ -690,43 +667,77 @@ class AttractorWindow(QMainWindow):
 
     def _apply_tick_settings(self):
         """Limit number of ticks to 5 per axis for cleaner visualization."""
-        from matplotlib.ticker import MaxNLocator
         self.ax.xaxis.set_major_locator(MaxNLocator(nbins=5))
         self.ax.yaxis.set_major_locator(MaxNLocator(nbins=5))
         self.ax.zaxis.set_major_locator(MaxNLocator(nbins=5))
 
-    def _redraw_plot(self):
-        """Redraw plot using cached data without recomputing."""
-        if self.data is None:
-            return
-
-        # Clear stats and equations text before clearing axis to prevent memory leak
-        if self.stats_text:
-            self.stats_text.remove()
-            self.stats_text = None
-        if self.equations_text:
-            self.equations_text.remove()
-            self.equations_text = None
-
+    def _reset_axes(self):
+        """Clear the axes and reapply labels and all visual settings."""
         self.ax.clear()
         self.ax.set_xlabel("x")
         self.ax.set_ylabel("y")
         self.ax.set_zlabel("z")
 
-        x, y, z = self.data[:, 0], self.data[:, 1], self.data[:, 2]
-
-        # Draw based on settings
-        if self.draw_line:
-            self.ax.plot(x, y, z, color=self.line_color, linewidth=0.6, alpha=0.9)
-        if self.draw_scatter:
-            self.ax.scatter(x, y, z, c=self.scatter_color, s=1, alpha=0.6)
-
-        # Apply all visual settings
+        # Apply visual settings
         self._apply_grid_settings()
         self._apply_axis_settings()
         self._apply_color_theme()
         self._apply_tick_settings()
 
+    def _redraw_plot(self):
+        """Redraw plot using cached data without recomputing.
+
+        The line and scatter artists persist between redraws and are updated
+        in place; the axes are only cleared and set up again when they no
+        longer hold them (first plot, or after an animation). Axis limits
+        follow new data but are left alone when only the style changes.
+        """
+        if self.data is None:
+            return
+
+        if self._gl_active():
+            self._redraw_gl()
+            return
+
+        line = self._plot_line
+        if line is None or line not in self.ax.lines:
+            self._reset_axes()
+            line, = self.ax.plot([], [], [], linewidth=0.6, alpha=0.9)
+            self._plot_line = line
+            self._plot_scatter = None
+            self._plot_data = None
+
+        x, y, z = self.data[:, 0], self.data[:, 1], self.data[:, 2]
+
+        if self._plot_data is not self.data:
+            line.set_data_3d(x, y, z)
+            self.ax.set_autoscale_on(True)
+            self.ax.auto_scale_xyz(x, y, z, had_data=False)
+            self._plot_data = self.data
+            if self._plot_scatter is not None:
+                self._plot_scatter.remove()
+                self._plot_scatter = None
+        line.set_color(self.line_color)
+        line.set_visible(self.draw_line)
+
+        scatter = self._plot_scatter
+        if scatter is not None and self._plot_scatter_color != self.scatter_color:
+            scatter.remove()
+            scatter = self._plot_scatter = None
+        if self.draw_scatter and scatter is None:
+            # Depth shading gives every marker its own color, which makes
+            # matplotlib draw them one at a time (about 9x slower per redraw)
+            s = max(1, len(x) // MAX_SCATTER_POINTS)
+            margins = self.ax.margins()
+            scatter = self._plot_scatter = self.ax.scatter(x[::s], y[::s], z[::s], c=self.scatter_color, s=1,
+                                                           alpha=0.6, depthshade=False)
+            # 3D scatter widens the z margin; keep the limits set by the line
+            # so toggling the markers doesn't rescale the plot
+            self.ax.margins(*margins)
+            self._plot_scatter_color = self.scatter_color
+        if scatter is not None:
+            scatter.set_visible(self.draw_scatter)
+
         # Update stats if enabled
         if self.show_stats:
             self.update_stats()
@@ -734,32 +745,100 @@ class AttractorWindow(QMainWindow):
         # Update equations overlay
         self.update_equations()
 
-        self.canvas.draw()
+        self.canvas.draw_idle()
+
+    def _gl_active(self):
+        """Whether plots and animation currently go to the OpenGL view."""
+        return self.gl_rendering
+
+    def _build_gl_view(self):
+        """Create the OpenGL view with persistent line, scatter, trail, grid and axis items."""
+        import pyqtgraph.opengl as gl
+
+        self.gl_view = gl.GLViewWidget()
+        self.gl_grid = gl.GLGridItem()
+        self.gl_axis = gl.GLAxisItem()
+        self.gl_line = gl.GLLinePlotItem(mode='line_strip', width=1.0, antialias=True)
+        self.gl_scatter = gl.GLScatterPlotItem(size=2.0, pxMode=True)
+        self.gl_trail = gl.GLScatterPlotItem(size=2.0, pxMode=True)  # Animation points
+        for item in (self.gl_grid, self.gl_axis, self.gl_line, self.gl_scatter, self.gl_trail):
+            self.gl_view.addItem(item)
+        self.plot_stack.addWidget(self.gl_view)
+
+    def _show_plot_view(self):
+        """Show the OpenGL view or the matplotlib canvas, whichever is active."""
+        use_gl = self._gl_active()
+        self.plot_stack.setCurrentWidget(self.gl_view if use_gl else self.canvas)
+        # The matplotlib toolbar only applies to the matplotlib canvas
+        self.toolbar_container.setVisible(not use_gl)
+
+    def _frame_gl_view(self, data):
+        """Center the OpenGL camera on an (N, 3) array of points."""
+        mins, maxs = data_bounds(data)
+        center = (mins + maxs) / 2
+        extent = float((maxs - mins).max()) or 1.0
+        self.gl_view.setCameraPosition(pos=QtGui.QVector3D(*center), distance=2.0 * extent,
+                                       elevation=20, azimuth=-60)
+        self.gl_grid.resetTransform()
+        self.gl_grid.setSize(extent, extent)
+        self.gl_grid.setSpacing(extent / 10, extent / 10)
+        self.gl_grid.translate(center[0], center[1], float(mins[2]))
+        self.gl_axis.setSize(extent / 2, extent / 2, extent / 2)
+
+    def _redraw_gl(self):
+        """Upload the cached data to the OpenGL view and apply the view settings.
+
+        The float32 (N, 3) array goes straight into a vertex buffer; projection
+        and rasterization happen on the GPU, so no per-point work is done in Python.
+        In animation mode only the animation trail is shown.
+        """
+        if self.data is not None:
+            pos = np.ascontiguousarray(self.data, dtype=np.float32)
+            self.gl_line.setData(pos=pos, color=to_rgba(self.line_color, 0.9))
+            self.gl_scatter.setData(pos=pos, color=to_rgba(self.scatter_color, 0.6))
+        self.gl_line.setVisible(self.draw_line and not self.animation_mode)
+        self.gl_scatter.setVisible(self.draw_scatter and not self.animation_mode)
+        self.gl_trail.setVisible(self.animation_mode)
+        self.gl_grid.setVisible(self.show_grid)
+        self.gl_axis.setVisible(self.show_axis)
+        self.gl_view.setBackgroundColor('k' if self.dark_mode else 'w')
 
     def rebuild_params(self):
         """Rebuild parameter fields for the currently selected attractor.
 
         Dynamically creates input fields based on the attractor's parameter
         definition in the ATTRACTORS dictionary. Applies tooltips to explain
-        the physical meaning of each parameter.
+        the physical meaning of each parameter. Attractors share most
+        parameter names, so rows are taken out of the layout rather than
+        deleted, and their widgets reused from self._field_pool.
         """
-        # Clear existing params
-        while self.params_layout.rowCount() > 0:
-            self.params_layout.removeRow(0)
-        self.param_fields.clear()
-
-        # Add new params
         attractor_name = self.attractor_combo.currentText()
         attractor_data = ATTRACTORS[attractor_name]
         params = attractor_data["params"]
         tooltips = attractor_data.get("tooltips", {})
 
+        # Take out existing rows; their widgets stay pooled for reuse, and
+        # only those this attractor doesn't use are hidden
+        while self.params_layout.rowCount() > 0:
+            self.params_layout.takeRow(0)
+        for pname, (label, field) in self._field_pool.items():
+            if pname not in params:
+                label.hide()
+                field.hide()
+        self.param_fields.clear()
+
+        # Add new params
         for pname, value in params.items():
-            field = QLineEdit(str(value))
-            if pname in tooltips:
-                field.setToolTip(tooltips[pname])
+            if pname not in self._field_pool:
+                self._field_pool[pname] = (QLabel(f"{pname}:"), QLineEdit())
+            label, field = self._field_pool[pname]
+            field.setText(str(value))
+            field.setToolTip(tooltips.get(pname, ""))
             self.param_fields[pname] = field
-            self.params_layout.addRow(f"{pname}:", field)
+            self.params_layout.addRow(label, field)
+            if field.isHidden():
+                label.show()
+                field.show()
 
         # Update initial conditions
         init = attractor_data["init"]
@@ -818,21 +897,27 @@ class AttractorWindow(QMainWindow):
         """Toggle grid visibility and pane fill."""
         self.show_grid = self.show_grid_action.isChecked()
         self._apply_grid_settings()
-        self.canvas.draw()
+        self.canvas.draw_idle()
+        if self._gl_active():
+            self._redraw_gl()
         self.statusBar().showMessage(f"Grid: {'ON' if self.show_grid else 'OFF'}")
 
     def toggle_axis(self):
         """Toggle axis labels and ticks visibility."""
         self.show_axis = self.show_axis_action.isChecked()
         self._apply_axis_settings()
-        self.canvas.draw()
+        self.canvas.draw_idle()
+        if self._gl_active():
+            self._redraw_gl()
         self.statusBar().showMessage(f"Axis: {'ON' if self.show_axis else 'OFF'}")
 
     def toggle_dark_mode(self):
         """Toggle between dark and light theme."""
         self.dark_mode = self.dark_mode_action.isChecked()
         self._apply_color_theme()
-        self.canvas.draw()
+        self.canvas.draw_idle()
+        if self._gl_active():
+            self._redraw_gl()
         self.statusBar().showMessage(f"Dark mode: {'ON' if self.dark_mode else 'OFF'}")
 
     def toggle_stats(self):
@@ -841,37 +926,70 @@ class AttractorWindow(QMainWindow):
         if not self.show_stats and self.stats_text:
             self.stats_text.remove()
             self.stats_text = None
-            self.canvas.draw()
+            self.canvas.draw_idle()
         elif self.show_stats:
             self.update_stats()
+        self._sync_stats_timer()
         self.statusBar().showMessage(f"Stats display: {'ON' if self.show_stats else 'OFF'}")
 
-    def update_stats(self):
+    def _sync_stats_timer(self):
+        """Run the stats refresh timer only while stats show during animation."""
+        if self.show_stats and self.animation_running and not self.isMinimized():
+            if self._stats_timer is None:
+                self._stats_timer = QtCore.QTimer()
+                self._stats_timer.timeout.connect(self._refresh_animation_stats)
+            if not self._stats_timer.isActive():
+                self._stats_frames = 0
+                self.last_plot_time = time.perf_counter()
+                self._stats_timer.start(STATS_REFRESH_MS)
+        elif self._stats_timer is not None:
+            self._stats_timer.stop()
+
+    def _refresh_animation_stats(self):
+        """Show the frame rate achieved since the last refresh (timer slot)."""
+        if self._gl_active():
+            # The overlay lives on the matplotlib canvas, hidden in GL mode
+            return
+        self.update_stats(self._stats_frames)
+        self._stats_frames = 0
+        if self.stats_text.stale:
+            self.canvas.draw_idle()
+
+    def update_stats(self, frames=1):
         """Update or create the FPS and memory usage overlay.
 
         Displays in lower-left corner with theme-appropriate colors.
-        FPS is calculated from time between updates.
+        FPS is calculated from time between updates. Memory is sampled at
+        most every STATS_MEMORY_INTERVAL seconds.
+
+        Args:
+            frames: Number of frames drawn since the previous update
         """
         # Calculate FPS
-        current_time = time.time()
+        current_time = time.perf_counter()
         if self.last_plot_time > 0:
-            fps = 1.0 / (current_time - self.last_plot_time) if (current_time - self.last_plot_time) > 0 else 0
+            fps = frames / (current_time - self.last_plot_time) if (current_time - self.last_plot_time) > 0 else 0
         else:
             fps = 0
         self.last_plot_time = current_time
 
         # Get memory usage
-        process = psutil.Process()
-        memory_mb = process.memory_info().rss / 1024 / 1024
+        if current_time - self._memory_sampled_at >= STATS_MEMORY_INTERVAL:
+            self._memory_mb = self._process.memory_info().rss / 1024 / 1024
+            self._memory_sampled_at = current_time
 
         # Update or create stats text
-        stats_str = f"FPS: {fps:.1f}\nMem: {memory_mb:.1f} MB"
+        stats_str = f"FPS: {fps:.1f}\nMem: {self._memory_mb:.1f} MB"
 
+        text_color = 'white' if self.dark_mode else 'black'
+        bg_color = 'black' if self.dark_mode else 'white'
         if self.stats_text:
+            if self.stats_text.get_text() == stats_str and self.stats_text.get_color() == text_color:
+                return  # Unchanged; leave the artist clean so no redraw is needed
             self.stats_text.set_text(stats_str)
+            self.stats_text.set_color(text_color)
+            self.stats_text.get_bbox_patch().set(facecolor=bg_color, edgecolor=text_color)
         else:
-            text_color = 'white' if self.dark_mode else 'black'
-            bg_color = 'black' if self.dark_mode else 'white'
             self.stats_text = self.fig.text(0.02, 0.02, stats_str,
                                            fontsize=9, family='Courier New',
                                            color=text_color,
@@ -879,7 +997,7 @@ class AttractorWindow(QMainWindow):
                                                     alpha=0.7, edgecolor=text_color))
 
     def update_equations(self):
-        """Display equations overlay on the plot."""
+        """Display equations overlay on the plot, updating it in place if shown."""
         if not self.current_attractor:
             return
 
@@ -896,6 +1014,14 @@ class AttractorWindow(QMainWindow):
         text_color = 'white' if self.dark_mode else 'black'
         bg_color = 'black' if self.dark_mode else 'white'
 
+        if self.equations_text:
+            if self.equations_text.get_text() == equations_str and self.equations_text.get_color() == text_color:
+                return
+            self.equations_text.set_text(equations_str)
+            self.equations_text.set_color(text_color)
+            self.equations_text.get_bbox_patch().set(facecolor=bg_color, edgecolor=text_color)
+            return
+
         # Create equations text in upper left corner
         self.equations_text = self.fig.text(0.02, 0.98, equations_str,
                                            fontsize=9, family='Courier New',
@@ -935,9 +1061,29 @@ class AttractorWindow(QMainWindow):
     def reset_view(self):
         """Reset 3D view to default elevation and azimuth angles."""
         self.ax.view_init(elev=20, azim=-60)
-        self.canvas.draw()
+        self.canvas.draw_idle()
+        if self._gl_active():
+            if self.animation_mode and self.animation_data is not None:
+                self._frame_gl_view(self.animation_data[:self.animation_step + 1])
+            elif self.data is not None:
+                self._frame_gl_view(self.data)
         self.statusBar().showMessage("View reset")
 
+    def toggle_gl_rendering(self):
+        """Switch plots and animation between matplotlib and the OpenGL view."""
+        self.gl_rendering = self.gl_rendering_action.isChecked()
+        if self.gl_rendering and self.gl_view is None:
+            self._build_gl_view()
+        self._show_plot_view()
+        if self._trajectories is not None:
+            # Re-sample for the new view's point budget; this also redraws
+            self._show_trajectory()
+        elif self.gl_rendering:
+            self._redraw_gl()
+        if self.gl_rendering and self.animation_mode and self.animation_data is not None:
+            self._frame_gl_view(self.animation_data[:self.animation_step + 1])
+        self.statusBar().showMessage(f"GPU rendering: {'ON' if self.gl_rendering else 'OFF'}")
+
     def toggle_left_panel(self):
         """Show or hide the left control panel (Ctrl+P)."""
         visible = self.toggle_panel_action.isChecked()
@@ -951,10 +1097,15 @@ class AttractorWindow(QMainWindow):
         # Show/hide appropriate UI elements
         self.animation_group.setVisible(self.animation_mode)
         self.buttons_widget.setVisible(not self.animation_mode)
+        if self._gl_active():
+            # The OpenGL view serves both modes; swap the static items for the trail
+            self._redraw_gl()
 
         # Stop animation if switching away from animation mode
-        if not self.animation_mode and self.animation_running:
-            self.pause_animation()
+        if not self.animation_mode:
+            if self.animation_running:
+                self.pause_animation()
+            self._cancel_animation_prep()
 
         self.statusBar().showMessage(f"Animation mode: {'ON' if self.animation_mode else 'OFF'}")
 
@@ -965,24 +1116,38 @@ class AttractorWindow(QMainWindow):
 
         # Update timer if running
         if self.animation_running and self.animation_timer:
-            self.animation_timer.setInterval(1000 // self.animation_speed)
+            self.animation_timer.setInterval(self._animation_interval())
+
+    def _animation_interval(self):
+        """Return the animation timer interval in ms.
+
+        This is the requested frame period, lengthened to the measured frame
+        cost when frames take longer, so timer events never pile up behind a
+        slow frame and input events still get serviced between frames.
+        """
+        return max(1000 // self.animation_speed, int((self._frame_cost or 0.0) * 1000) + 1)
 
     def on_animation_steps_changed(self, text):
         """Handle changes to the animation steps field.
 
         Synchronizes with Plot Settings and updates progress display.
-        Only processes valid integer inputs.
+        Only processes valid integer inputs. The step count takes effect at
+        once, so Play always sees it; the progress label, which relays out
+        the panel, is only updated once typing pauses.
         """
         try:
             if text:  # Only process non-empty text
                 steps = int(text)
                 if steps > 0:
                     self.steps = steps
-                    # Update progress label format
-                    self.progress_label.setText(f"Progress: {self.animation_step:,} / {self.steps:,}")
+                    self._steps_label_debounce.start(STEPS_EDIT_DEBOUNCE_MS)
         except ValueError:
             pass  # Ignore invalid input during typing
 
+    def _update_progress_label(self):
+        """Show the current animation progress against the total steps."""
+        self.progress_label.setText(f"Progress: {self.animation_step:,} / {self.steps:,}")
+
     def update_steps_per_frame(self, value):
         """Update steps per frame from slider."""
         self.steps_per_frame = value
@@ -1008,107 +1173,204 @@ class AttractorWindow(QMainWindow):
         self.animation_fixed_scale = self.fixed_scale_checkbox.isChecked()
 
     def play_animation(self):
-        """Start or resume the animation."""
-        if not self.animation_mode:
+        """Start or resume the animation.
+
+        A fresh start compiles the specialized stepper and samples the
+        attractor's bounds on a worker thread, which takes up to a second for
+        a new parameter set; the animation begins in _on_animation_prepared.
+        """
+        if not self.animation_mode or self._animation_prep is not None:
             return
 
-        # Get parameters
         try:
             attractor_name = self.attractor_combo.currentText()
             self.current_attractor = attractor_name
-            deriv = ATTRACTORS[attractor_name]["deriv"]
 
-            params = {}
-            for pname, field in self.param_fields.items():
-                params[pname] = float(field.text())
+            # Initialize animation if starting fresh. Fields are parsed only
+            # here; resuming reuses the cached deriv/params untouched.
+            if self.animation_state is None:
+                params = {}
+                for pname, field in self.param_fields.items():
+                    params[pname] = float(field.text())
 
-            initial = np.array([
-                float(self.x0_field.text()),
-                float(self.y0_field.text()),
-                float(self.z0_field.text())
-            ])
+                initial = self._read_initial_conditions()
+                self._animation_params = params
 
-            # Initialize animation if starting fresh
-            if self.animation_state is None:
-                self.animation_step = 0
-                self.animation_state = initial.copy()
-                self.animation_data = [initial.copy()]
-                self.animation_deriv = deriv
-                self.animation_params = params
-
-                # Pre-compute axis limits if fixed scaling is enabled
-                if self.animation_fixed_scale:
-                    # Run a quick integration to determine typical bounds
-                    from attractors import rk4_integrate
-                    sample_data = rk4_integrate(deriv, initial, params, self.dt, min(2000, self.steps))
-                    x_min, x_max = sample_data[:, 0].min(), sample_data[:, 0].max()
-                    y_min, y_max = sample_data[:, 1].min(), sample_data[:, 1].max()
-                    z_min, z_max = sample_data[:, 2].min(), sample_data[:, 2].max()
-
-                    # Add 10% padding
-                    x_padding = (x_max - x_min) * 0.1
-                    y_padding = (y_max - y_min) * 0.1
-                    z_padding = (z_max - z_min) * 0.1
-
-                    self.animation_axis_limits = {
-                        'x': (x_min - x_padding, x_max + x_padding),
-                        'y': (y_min - y_padding, y_max + y_padding),
-                        'z': (z_min - z_padding, z_max + z_padding)
-                    }
-                else:
-                    self.animation_axis_limits = None
+                # Bounds are needed for the fixed axis limits and for framing
+                # the OpenGL camera
+                sample_bounds = self.animation_fixed_scale or self._gl_active()
+                self._launch_animation_prep(attractor_name, params, initial, sample_bounds)
+                return
+
+            self._start_animation_timer()
+
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to start animation:\n{str(e)}")
+            self.statusBar().showMessage(f"Error: {str(e)}")
 
-                # Clear equations text before clearing axis
-                if self.equations_text:
-                    self.equations_text.remove()
-                    self.equations_text = None
+    def _launch_animation_prep(self, attractor_name, params, initial, sample_bounds):
+        """Start _prepare_animation on a worker thread for the current dt and steps."""
+        job = self._animation_prep = object()
+        self.play_btn.setEnabled(False)
+        self.statusBar().showMessage("Preparing animation...")
+        threading.Thread(target=self._prepare_animation, name="animation-prep",
+                         args=(job, attractor_name, params, initial, self.dt, self.steps, sample_bounds),
+                         daemon=True).start()
 
-                # Clear plot
-                self.ax.clear()
-                self.ax.set_xlabel("x")
-                self.ax.set_ylabel("y")
-                self.ax.set_zlabel("z")
+    def _prepare_animation(self, job, attractor_name, params, initial, dt, steps, sample_bounds):
+        """Compile the stepper and sample bounds for a fresh animation.
 
-                # Apply visual settings
-                self._apply_grid_settings()
-                self._apply_axis_settings()
-                self._apply_color_theme()
-                self._apply_tick_settings()
+        Runs on a worker thread and hands (initial, dt, run, sample_data), or
+        the exception raised, back to the GUI thread via animation_prepared.
+        """
+        try:
+            # Specialized stepper with the parameters compiled in as constants
+            _, run = make_stepper(attractor_name, params, dt)
+            # Numba compiles on the first call; make that call here, on a
+            # scratch slice of the same type as the animation buffer's rows
+            run(*initial, dt, np.empty((3, 3), dtype=np.float32, order='F')[1:])
+
+            # Run a quick integration to determine typical bounds
+            sample_data = None
+            if sample_bounds:
+                sample_data = integrate(attractor_name, initial, params, dt, min(2000, steps))
+            result = (initial, dt, run, sample_data)
+        except Exception as e:
+            result = e
+        self.animation_prepared.emit(job, result)
 
-                # Update equations overlay
-                self.update_equations()
+    def _on_animation_prepared(self, job, result):
+        """Set up a fresh animation from _prepare_animation's results and start it.
 
-                # Initialize scatter plot
-                self.animation_scatter = None
-                self.animation_azim = -60
+        For an animation already in progress only the stepper is swapped in,
+        and the timer restarted if it was running before the rebuild.
+        """
+        if job is not self._animation_prep:
+            # Reset, attractor switched or animation mode left meanwhile
+            return
+        self._animation_prep = None
 
-            # Start timer
-            if not self.animation_timer:
-                self.animation_timer = QtCore.QTimer()
-                self.animation_timer.timeout.connect(self.animate_step)
+        try:
+            if isinstance(result, Exception):
+                raise result
+            initial, dt, run, sample_data = result
+
+            if dt != self.dt:
+                # Plot Settings changed dt while this was compiling; the fused
+                # stepper has the old one built in, so start over with the new
+                sample_bounds = (self.animation_state is None
+                                 and (self.animation_fixed_scale or self._gl_active()))
+                self._launch_animation_prep(self.current_attractor, self._animation_params,
+                                            initial, sample_bounds)
+                return
+
+            self.animation_run = run
+            if self.animation_state is not None:
+                # Stepper rebuilt for a new dt; carry on from the current state
+                if self._resume_after_prep:
+                    self._start_animation_timer()
+                else:
+                    self.play_btn.setEnabled(True)
+                    self.statusBar().showMessage(f"Animation stepper rebuilt for dt={self.dt}")
+                return
+
+            self.animation_step = 0
+            self.animation_state = initial
+            # Preallocate the whole run; frames draw views into this buffer.
+            # Column-major, so each coordinate of the trail is a contiguous
+            # slice matplotlib can take without gathering a strided column
+            self.animation_data = np.empty((self.steps + 1, 3), dtype=np.float32, order='F')
+            self.animation_data[0] = self.animation_state
+
+            if self._gl_active() and sample_data is not None:
+                self._frame_gl_view(sample_data)
+
+            # Pre-compute axis limits if fixed scaling is enabled
+            if self.animation_fixed_scale and sample_data is not None:
+                (x_min, y_min, z_min), (x_max, y_max, z_max) = data_bounds(sample_data)
+
+                # Add 10% padding
+                x_padding = (x_max - x_min) * 0.1
+                y_padding = (y_max - y_min) * 0.1
+                z_padding = (z_max - z_min) * 0.1
+
+                self.animation_axis_limits = {
+                    'x': (x_min - x_padding, x_max + x_padding),
+                    'y': (y_min - y_padding, y_max + y_padding),
+                    'z': (z_min - z_padding, z_max + z_padding)
+                }
+            else:
+                self.animation_axis_limits = None
 
-            self.animation_timer.start(1000 // self.animation_speed)
-            self.animation_running = True
+            # Clear plot
+            self._reset_axes()
 
-            # Update button states
-            self.play_btn.setEnabled(False)
-            self.pause_btn.setEnabled(True)
+            # Update equations overlay
+            self.update_equations()
 
-            # Disable steps field while running
-            self.animation_steps_field.setEnabled(False)
+            # Initialize scatter plot; the first frame does a full draw
+            self.animation_scatter = None
+            self._blit_background = None
+            self.animation_azim = -60
 
-            self.statusBar().showMessage("Animation started")
+            self._start_animation_timer()
 
         except Exception as e:
+            self.play_btn.setEnabled(True)
             QMessageBox.critical(self, "Error", f"Failed to start animation:\n{str(e)}")
             self.statusBar().showMessage(f"Error: {str(e)}")
 
+    def _rebuild_animation_stepper(self):
+        """Recompile the paused or running animation's stepper for the current dt.
+
+        The compile runs on the animation-prep worker, as for a fresh start. A
+        running animation is paused meanwhile so no frame uses the old dt.
+        """
+        self._resume_after_prep = self.animation_running
+        if self.animation_running:
+            self.pause_animation()
+        self._launch_animation_prep(self.current_attractor, self._animation_params,
+                                    self.animation_state, False)
+
+    def _cancel_animation_prep(self):
+        """Drop the result of a pending _prepare_animation, if any."""
+        if self._animation_prep is not None:
+            self._animation_prep = None
+            self.play_btn.setEnabled(True)
+
+    def _start_animation_timer(self):
+        """Start the frame timer on the prepared (or paused) animation."""
+        # Start timer
+        if not self.animation_timer:
+            self.animation_timer = QtCore.QTimer()
+            # Coarse timers may fire up to 5% early or late, which shows
+            # as uneven frame pacing; the frame period is only ~16-100 ms
+            self.animation_timer.setTimerType(Qt.TimerType.PreciseTimer)
+            self.animation_timer.timeout.connect(self.animate_step)
+
+        self._slow_frames = 0
+        self._frame_catch_up = 1
+        self._frame_cost = None
+        self.animation_timer.start(self._animation_interval())
+        self.animation_running = True
+        self._sync_stats_timer()
+
+        # Update button states
+        self.play_btn.setEnabled(False)
+        self.pause_btn.setEnabled(True)
+
+        # Disable steps field while running
+        self.animation_steps_field.setEnabled(False)
+
+        self.statusBar().showMessage("Animation started")
+
     def pause_animation(self):
         """Pause the animation."""
         if self.animation_timer:
             self.animation_timer.stop()
 
         self.animation_running = False
+        self._sync_stats_timer()
 
         # Update button states
         self.play_btn.setEnabled(True)
@@ -1119,11 +1381,27 @@ class AttractorWindow(QMainWindow):
 
         self.statusBar().showMessage("Animation paused")
 
+    def changeEvent(self, event):
+        """Hold the animation timers while the window is minimized.
+
+        No frame can be seen then, so nothing is integrated or drawn; the
+        animation stays running and continues from where it was on restore.
+        """
+        if event.type() == QtCore.QEvent.Type.WindowStateChange and self.animation_running:
+            if self.isMinimized():
+                self.animation_timer.stop()
+            elif not self.animation_timer.isActive():
+                self._frame_cost = None
+                self.animation_timer.start(self._animation_interval())
+            self._sync_stats_timer()
+        super().changeEvent(event)
+
     def reset_animation(self):
         """Reset animation to the beginning."""
         # Stop if running
         if self.animation_running:
             self.pause_animation()
+        self._cancel_animation_prep()
 
         # Clear animation state
         self.animation_step = 0
@@ -1133,27 +1411,15 @@ class AttractorWindow(QMainWindow):
         self.animation_azim = -60
         self.animation_axis_limits = None
 
-        # Clear equations text before clearing axis
-        if self.equations_text:
-            self.equations_text.remove()
-            self.equations_text = None
-
         # Clear plot
-        self.ax.clear()
-        self.ax.set_xlabel("x")
-        self.ax.set_ylabel("y")
-        self.ax.set_zlabel("z")
-
-        # Apply visual settings
-        self._apply_grid_settings()
-        self._apply_axis_settings()
-        self._apply_color_theme()
-        self._apply_tick_settings()
+        self._reset_axes()
 
         # Update equations overlay
         self.update_equations()
 
-        self.canvas.draw()
+        self.canvas.draw_idle()
+        if self.gl_view is not None:
+            self.gl_trail.setData(pos=np.empty((0, 3), dtype=np.float32))
 
         # Update progress and ensure steps field is enabled
         self.progress_label.setText(f"Progress: 0 / {self.steps:,}")
@@ -1165,8 +1431,11 @@ class AttractorWindow(QMainWindow):
         """Perform one animation step.
 
         Computes steps_per_frame integration steps and updates the plot.
-        Implements memory optimization by limiting trail length to prevent
-        unbounded memory growth during long animations.
+        If frames repeatedly take longer than the requested frame period, the
+        step count is scaled up so the animation keeps pace in real time.
+        New states are written into the preallocated animation buffer, and
+        only a view of the last trail_length points is handed to the matplotlib
+        canvas or the OpenGL view, whichever is active.
         """
         if self.animation_step >= self.steps:
             # Animation complete
@@ -1174,61 +1443,103 @@ class AttractorWindow(QMainWindow):
             self.statusBar().showMessage("Animation complete")
             return
 
-        # Compute multiple steps per frame
-        for _ in range(self.steps_per_frame):
-            if self.animation_step >= self.steps:
-                break
+        frame_start = time.perf_counter()
+
+        # Total steps may have been raised since the buffer was allocated,
+        # while paused or from Plot Settings during playback
+        if len(self.animation_data) < self.steps + 1:
+            grown = np.empty((self.steps + 1, 3), dtype=np.float32, order='F')
+            grown[:self.animation_step + 1] = self.animation_data[:self.animation_step + 1]
+            self.animation_data = grown
+
+        # Compute all of this frame's steps in one call, writing straight into
+        # the next rows of the animation buffer
+        step = self.animation_step
+        n = min(self.steps_per_frame * self._frame_catch_up, self.steps - step)
+        x, y, z = self.animation_state
+        self.animation_state = self.animation_run(x, y, z, self.dt,
+                                                  self.animation_data[step + 1:step + 1 + n])
+        self.animation_step = step + n
+        self._stats_frames += 1
+
+        # Only the last N points are visible; slicing gives a view, not a copy
+        end = self.animation_step + 1
+        data_array = self.animation_data[max(0, end - self.animation_trail_length):end]
+
+        # Fade state is kept current by toggle_fade, no need to query the widget
+        if self.animation_fade and len(data_array) > 100:
+            # Create fade effect - newer points are more opaque. Once the
+            # trail is full its length stays put, so the ramp is reused
+            alphas = self._fade_alphas
+            if alphas is None or len(alphas) != len(data_array):
+                alphas = self._fade_alphas = np.linspace(0.1, 0.8, len(data_array))
+        else:
+            # No fade - uniform fully opaque points
+            alphas = 1.0
 
-            # RK4 integration step
-            state = self.animation_state
-            dt = self.dt
-            k1 = self.animation_deriv(state, self.animation_params)
-            k2 = self.animation_deriv(state + 0.5 * dt * k1, self.animation_params)
-            k3 = self.animation_deriv(state + 0.5 * dt * k2, self.animation_params)
-            k4 = self.animation_deriv(state + dt * k3, self.animation_params)
-            new_state = state + (dt / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
-
-            self.animation_state = new_state
-            self.animation_data.append(new_state.copy())
-            self.animation_step += 1
-
-        # Limit memory by keeping only last N points
-        # This frees memory used by points that have faded to zero
-        if len(self.animation_data) > self.animation_trail_length:
-            self.animation_data = self.animation_data[-self.animation_trail_length:]
-
-        # Update plot
-        data_array = np.array(self.animation_data)
-        x, y, z = data_array[:, 0], data_array[:, 1], data_array[:, 2]
-
-        # Clear and redraw scatter (scatter artists can't be updated directly)
-        # Always clear all collections to ensure clean state
-        for collection in self.ax.collections[:]:
-            try:
-                collection.remove()
-            except (NotImplementedError, ValueError):
-                pass
-        self.animation_scatter = None
+        # Update progress label
+        self.progress_label.setText(f"Progress: {self.animation_step:,} / {self.steps:,}")
 
-        # Determine alpha values based on current fade checkbox state
-        # Always read from checkbox to ensure real-time updates
-        fade_enabled = self.fade_checkbox.isChecked()
+        if self._gl_active():
+            self._draw_gl_frame(data_array, alphas)
+        else:
+            self._draw_canvas_frame(data_array, alphas)
+
+        # When rendering can't keep up with the requested FPS, skip samples
+        # (more steps per frame) rather than letting the animation fall behind
+        period = 1.0 / self.animation_speed
+        elapsed = time.perf_counter() - frame_start
+        if elapsed > period:
+            self._slow_frames += 1
+            if self._slow_frames >= ANIMATION_LAG_FRAMES:
+                self._frame_catch_up = math.ceil(elapsed / period)
+        else:
+            self._slow_frames = 0
+            self._frame_catch_up = 1
 
-        # Draw scatter points with current fade setting
-        if fade_enabled and len(data_array) > 100:
-            # Create fade effect - newer points are more opaque
-            alphas = np.linspace(0.1, 0.8, len(data_array))
-            self.animation_scatter = self.ax.scatter(x, y, z,
-                                                    c=self.scatter_color,
-                                                    s=1,
-                                                    alpha=alphas)
+        # The first frame after play also compiles the stepper and renders
+        # the full figure, so it is left out of the average
+        if self._frame_cost is None:
+            self._frame_cost = 0.0
         else:
-            # No fade - uniform fully opaque points
-            # Explicitly set alpha=1.0 to ensure full opacity
+            self._frame_cost += ANIMATION_COST_SMOOTHING * (elapsed - self._frame_cost)
+        interval = self._animation_interval()
+        if (self.animation_running
+                and abs(interval - self.animation_timer.interval()) > ANIMATION_INTERVAL_SLACK_MS):
+            self.animation_timer.setInterval(interval)
+
+    def _draw_canvas_frame(self, trail, alphas):
+        """Draw one animation frame on the matplotlib canvas.
+
+        Args:
+            trail: (N, 3) view of the visible trail
+            alphas: Per-point opacity array, or a single opacity
+        """
+        x, y, z = trail[:, 0], trail[:, 1], trail[:, 2]
+        scatter = self.animation_scatter
+        if (scatter is None or scatter not in self.ax.collections
+                or self._animation_scatter_color != self.scatter_color):
+            # First frame, axes were cleared, or the color changed: build the
+            # scatter from scratch, dropping any collections left on the axes.
+            # Drawn flat like the static scatter: depth shading recolors every
+            # point each draw, and with uniform opacity (no fade) flat markers
+            # are rasterized as one batch, over 10x faster
+            for collection in self.ax.collections[:]:
+                try:
+                    collection.remove()
+                except (NotImplementedError, ValueError):
+                    pass
             self.animation_scatter = self.ax.scatter(x, y, z,
                                                     c=self.scatter_color,
                                                     s=1,
-                                                    alpha=1.0)
+                                                    alpha=alphas,
+                                                    depthshade=False,
+                                                    animated=True)
+            self._animation_scatter_color = self.scatter_color
+        else:
+            # Move the existing points instead of building a new collection
+            scatter._offsets3d = (x, y, z)
+            scatter.set_alpha(alphas)
 
         # Apply fixed axis limits if enabled
         if self.animation_fixed_scale and self.animation_axis_limits:
@@ -1236,16 +1547,60 @@ class AttractorWindow(QMainWindow):
             self.ax.set_ylim(self.animation_axis_limits['y'])
             self.ax.set_zlim(self.animation_axis_limits['z'])
 
-        # Auto-rotate if enabled
+        # Auto-rotate if enabled. The view is only moved once the angle has
+        # advanced a whole ANIMATION_ROTATE_STEP, so the frames in between
+        # keep the last rendered view and can be blitted
+        view_moved = False
         if self.animation_auto_rotate:
             self.animation_azim += 0.5
-            self.ax.view_init(elev=20, azim=self.animation_azim)
+            if abs(self.animation_azim - self.ax.azim) >= ANIMATION_ROTATE_STEP:
+                self.ax.view_init(elev=20, azim=self.animation_azim)
+                view_moved = True
+
+        # With a static view only the scatter changes, so blit it over the
+        # cached background instead of re-rendering the whole figure
+        if (self.animation_fixed_scale and self.animation_axis_limits
+                and not view_moved
+                and self._blit_background is not None):
+            self.canvas.restore_region(self._blit_background)
+            self._draw_animated_artists()
+            self.canvas.blit(self.fig.bbox)
+        else:
+            self.canvas.draw()
 
-        # Update progress label
-        self.progress_label.setText(f"Progress: {self.animation_step:,} / {self.steps:,}")
+    def _draw_gl_frame(self, trail, alphas):
+        """Draw one animation frame in the OpenGL view.
+
+        The trail and its colors go to the GPU as one vertex buffer upload;
+        the camera stays where play_animation framed it.
+
+        Args:
+            trail: (N, 3) view of the visible trail
+            alphas: Per-point opacity array, or a single opacity
+        """
+        color = np.empty((len(trail), 4), dtype=np.float32)
+        color[:] = to_rgba(self.scatter_color)
+        color[:, 3] = alphas
+        self.gl_trail.setData(pos=np.ascontiguousarray(trail), color=color)
+        if self.animation_auto_rotate:
+            self.gl_view.orbit(0.5, 0)
 
-        # Redraw
-        self.canvas.draw()
+    def _on_canvas_draw(self, event):
+        """Cache the freshly rendered figure as the blit background.
+
+        Animated artists are skipped by a full draw, so the animation scatter
+        is drawn on top afterwards to keep it visible while paused.
+        """
+        self._blit_background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated_artists()
+
+    def _draw_animated_artists(self):
+        """Project and draw the animation scatter onto the canvas."""
+        scatter = self.animation_scatter
+        if scatter is not None and scatter in self.ax.collections:
+            # 3D collections must be projected with the current view before drawing
+            scatter.do_3d_projection()
+            self.ax.draw_artist(scatter)
 
     def show_plot_settings(self):
         """Display dialog for adjusting integration parameters.
@@ -1254,6 +1609,8 @@ class AttractorWindow(QMainWindow):
             steps: Number of integration steps
             dt: Time step size (smaller = more accurate)
             stride: Plot every Nth point (higher = faster)
+            solver: Integration method, one of SOLVERS
+            rtol: Relative tolerance of the adaptive solvers
         """
         dialog = QDialog(self)
         dialog.setWindowTitle("Plot Settings")
@@ -1273,6 +1630,21 @@ class AttractorWindow(QMainWindow):
         stride_field.setToolTip("Plot every Nth point (higher = faster but less detailed)")
         layout.addRow("Stride:", stride_field)
 
+        solver_combo = QComboBox()
+        for index, (solver, description) in enumerate(SOLVERS.items()):
+            solver_combo.addItem(f"{solver} - {description}", solver)
+            if solver in SCIPY_SOLVERS and not HAVE_SCIPY:
+                solver_combo.model().item(index).setEnabled(False)
+        solver_combo.setCurrentIndex(solver_combo.findData(self.solver))
+        solver_combo.setToolTip("Adaptive solvers pick their own steps and are sampled every dt"
+                                + ("" if HAVE_SCIPY else "; the SciPy ones are unavailable"))
+        layout.addRow("Solver:", solver_combo)
+
+        rtol_field = QLineEdit(f"{self.rtol:g}")
+        rtol_field.setToolTip("Relative error tolerance of the adaptive solvers "
+                              "(larger = fewer, longer steps; ignored by RK4 and Tsit5)")
+        layout.addRow("Tolerance:", rtol_field)
+
         # Buttons
         btn_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
         btn_box.accepted.connect(dialog.accept)
@@ -1281,9 +1653,32 @@ class AttractorWindow(QMainWindow):
 
         if dialog.exec() == QDialog.DialogCode.Accepted:
             try:
-                self.steps = int(steps_field.text())
-                self.dt = float(dt_field.text())
-                self.stride = int(stride_field.text())
+                # Validate every field before applying any, so a bad entry
+                # leaves the previous settings intact
+                steps = int(steps_field.text())
+                if steps < 1:
+                    raise ValueError("steps must be at least 1")
+                dt = float(dt_field.text())
+                if not (math.isfinite(dt) and dt > 0):
+                    raise ValueError("dt must be a positive number")
+                stride = int(stride_field.text())
+                if stride < 1:
+                    raise ValueError("stride must be at least 1")
+                rtol = float(rtol_field.text())
+                if not 0 < rtol < 1:
+                    raise ValueError("tolerance must be between 0 and 1")
+
+                dt_changed = dt != self.dt
+                self.steps = steps
+                self.dt = dt
+                self.stride = stride
+                self.solver = solver_combo.currentData()
+                self.rtol = rtol
+
+                # An animation in progress continues with the new dt. A pending
+                # prep notices the change itself when its result arrives
+                if dt_changed and self.animation_state is not None and self._animation_prep is None:
+                    self._rebuild_animation_stepper()
 
                 # Sync animation steps field
                 self.animation_steps_field.setText(str(self.steps))
@@ -1334,48 +1729,149 @@ SOFTWARE."""
         msg.setIcon(QMessageBox.Icon.Information)
         msg.exec()
 
+    def _read_initial_conditions(self):
+        """Parse the x0, y0, z0 fields in one pass.
+
+        Returns:
+            Tuple (x0, y0, z0) of floats, usable directly as scalar state
+
+        Raises:
+            ValueError: Naming the first field that is not a number
+        """
+        values = []
+        for label, field in (("x0", self.x0_field), ("y0", self.y0_field), ("z0", self.z0_field)):
+            try:
+                values.append(float(field.text()))
+            except ValueError:
+                raise ValueError(f"Initial condition {label} must be a number, got {field.text()!r}") from None
+        return tuple(values)
+
     def create_plot(self):
         """Create or regenerate the attractor plot.
 
         Performs RK4 integration with current parameters and displays the result.
         Data is cached in self.data for efficient redrawing when only visual
-        settings change.
+        settings change, and the full trajectory is reused when regenerating
+        with unchanged inputs.
 
-        Performance: ~200ms for 20,000 steps on typical hardware.
+        Performance: a few ms for 20,000 steps once the attractor's JIT
+        kernel is compiled (~200ms on the pure-Python fallback).
         """
         try:
             # Get parameters
             attractor_name = self.attractor_combo.currentText()
-            deriv = ATTRACTORS[attractor_name]["deriv"]
 
             params = {}
             for pname, field in self.param_fields.items():
                 params[pname] = float(field.text())
 
-            initial = np.array([
-                float(self.x0_field.text()),
-                float(self.y0_field.text()),
-                float(self.z0_field.text())
-            ])
+            initial = self._read_initial_conditions()
+
+            batch = int(self.batch_field.text())
+            if batch < 1:
+                raise ValueError("Batch size must be at least 1")
 
             # Use instance variables for plot settings
             steps = self.steps
             dt = self.dt
-            stride = self.stride
 
-            # Integrate
-            data = rk4_integrate(deriv, initial, params, dt, steps)
-            self.data = data[::stride]
+            # Integrate only for inputs not seen recently; a new stride just
+            # re-samples the cached result. For fixed-step solvers the step
+            # count is not part of the key: fewer steps take a prefix of the
+            # cached run, and more steps continue it from its final states,
+            # integrating only the new part. Adaptive runs would come out
+            # different from a fresh run, so they are cached per step count
+            resumable = self.solver in FIXED_STEP_SOLVERS
+            key = (attractor_name, tuple(params.items()), initial, dt, None if resumable else steps,
+                   self.solver, None if resumable else self.rtol, batch)
+            if key in self._trajectory_cache:
+                self._trajectory_cache.move_to_end(key)
+                trajectories, finals = self._trajectory_cache[key]
+                cached_steps = trajectories.shape[1]
+                if cached_steps < steps:
+                    tail = self._integrate_runs(attractor_name, finals, params, dt, steps - cached_steps + 1)
+                    trajectories = np.concatenate((trajectories, tail[:, 1:].astype(np.float32)), axis=1)
+                    finals = tail[:, -1]
+                    self._trajectory_cache[key] = (trajectories, finals)
+            else:
+                # First trajectory starts exactly at the entered state
+                inits = np.tile(initial, (batch, 1))
+                inits[1:] += np.random.default_rng().normal(0.0, BATCH_JITTER, (batch - 1, 3))
+                runs = self._integrate_runs(attractor_name, inits, params, dt, steps)
+                # Only ever plotted from here on: keep the cache in float32, but
+                # the final states in full precision so runs continue exactly
+                trajectories = runs.astype(np.float32)
+                finals = runs[:, -1].copy()
+                self._trajectory_cache[key] = (trajectories, finals)
+                if len(self._trajectory_cache) > TRAJECTORY_CACHE_SIZE:
+                    self._trajectory_cache.popitem(last=False)
+            self._trajectories = trajectories[:, :steps]
+
+            # Update the trajectory selector without triggering a redraw per change
+            self.trajectory_slider.blockSignals(True)
+            self.trajectory_slider.setMaximum(batch - 1)
+            self.trajectory_slider.blockSignals(False)
+            self.trajectory_slider.setEnabled(batch > 1)
+            self.trajectory_label.setText(str(self.trajectory_slider.value() + 1))
             self.current_attractor = attractor_name
 
-            # Use efficient redraw method
-            self._redraw_plot()
+            self._show_trajectory()
             self.statusBar().showMessage(f"{attractor_name} plot created with {len(self.data)} points")
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to create plot:\n{str(e)}")
             self.statusBar().showMessage(f"Error: {str(e)}")
 
+    def _integrate_runs(self, attractor_name, inits, params, dt, steps):
+        """Integrate one trajectory per initial state with the selected solver.
+
+        Args:
+            attractor_name: Key into ATTRACTORS
+            inits: Initial states, array of shape (B, 3)
+            params: Dictionary of parameters for the attractor
+            dt: Time step size
+            steps: Number of integration steps to compute
+
+        Returns:
+            Numpy array of shape (B, steps, 3) containing all trajectories
+        """
+        if len(inits) == 1:
+            return integrate_with(self.solver, attractor_name, inits[0], params, dt, steps, self.rtol)[np.newaxis]
+        if self.solver == "RK4":
+            return integrate_many(attractor_name, inits, params, dt, steps)
+        return np.stack([integrate_with(self.solver, attractor_name, init, params, dt, steps, self.rtol)
+                         for init in inits])
+
+    def _show_trajectory(self):
+        """Sample the selected cached trajectory into self.data and redraw it."""
+        data = self._trajectories[self.trajectory_slider.value()]
+        stride = self.stride
+        # Raise the stride when needed so at most MAX_RENDER_POINTS (or
+        # MAX_GL_RENDER_POINTS in the OpenGL view) are rendered
+        max_points = MAX_GL_RENDER_POINTS if self._gl_active() else MAX_RENDER_POINTS
+        if len(data) // stride > max_points:
+            stride = -(-len(data) // max_points)
+        # The cache is float32 already (visually identical to float64 and
+        # half the bytes for matplotlib to touch); just take a compact copy
+        self.data = np.ascontiguousarray(data[::stride])
+
+        # Use efficient redraw method
+        self._redraw_plot()
+        if self._gl_active():
+            self._frame_gl_view(self.data)
+
+    def select_trajectory(self, index):
+        """Display another trajectory of the last batch without re-integrating.
+
+        Args:
+            index: Zero-based trajectory index from the slider
+        """
+        self.trajectory_label.setText(str(index + 1))
+        if self._trajectories is None or index >= len(self._trajectories):
+            return
+        self._show_trajectory()
+        self.statusBar().showMessage(f"Showing trajectory {index + 1} of {len(self._trajectories)}")
+
 
 def main():
     """Main entry point for the application."""
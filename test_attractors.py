@@ -3,7 +3,7 @@
 
 import sys
 import numpy as np
-from attractors import lorenz, rossler, thomas, aizawa, rk4_integrate, ATTRACTORS
+from attractor_core import lorenz, rossler, thomas, aizawa, rk4_integrate, integrate, integrate_batch, integrate_many, integrate_many_cuda, integrate_adaptive, integrate_tsit5, integrate_specialized, integrate_with, data_bounds, SOLVERS, SCIPY_SOLVERS, FIXED_STEP_SOLVERS, HAVE_SCIPY, HAVE_CUDA, ATTRACTORS
 
 
 def test_attractor(name, attractor_def):
@@ -24,6 +24,19 @@ def test_attractor(name, attractor_def):
         assert not np.any(np.isnan(data)), "Data contains NaN values"
         assert not np.any(np.isinf(data)), "Data contains Inf values"
 
+        # float32 storage only rounds the stored points; the state stays float64
+        data32 = rk4_integrate(deriv, initial, params, dt, steps, dtype=np.float32)
+        assert data32.dtype == np.float32, f"Expected float32, got {data32.dtype}"
+        assert np.array_equal(data32, data.astype(np.float32)), "float32 storage changed the trajectory"
+
+        # Parameters are bound by name, not by the dictionary's key order
+        reordered = dict(reversed(list(params.items())))
+        assert np.array_equal(rk4_integrate(deriv, initial, reordered, dt, steps), data), \
+            "Reordered parameters changed the trajectory"
+        assert np.array_equal(integrate_batch(deriv, [initial], reordered, dt, steps),
+                              integrate_batch(deriv, [initial], params, dt, steps)), \
+            "Reordered parameters changed the batch trajectory"
+
         print(f"  ✓ Integration successful")
         print(f"  ✓ Generated {steps} points")
         print(f"  ✓ Data range: X[{data[:,0].min():.2f}, {data[:,0].max():.2f}], "
@@ -36,6 +49,355 @@ def test_attractor(name, attractor_def):
         return False
 
 
+def test_jit_matches_reference(name, attractor_def):
+    """Test that the specialized integrator reproduces rk4_integrate."""
+    print(f"\nTesting {name} JIT integrator...")
+
+    initial = np.array([0.1, 0.0, 0.0], dtype=float)
+    dt = 0.01
+    steps = 500
+
+    try:
+        reference = rk4_integrate(attractor_def["deriv"], initial, attractor_def["params"], dt, steps)
+        data = integrate(name, initial, attractor_def["params"], dt, steps)
+
+        assert data.shape == reference.shape, f"Expected shape {reference.shape}, got {data.shape}"
+        assert np.allclose(data, reference, rtol=1e-9, atol=1e-9), "JIT trajectory diverges from reference"
+
+        # Parameters are matched by name, not by dictionary order
+        reordered = dict(reversed(list(attractor_def["params"].items())))
+        assert np.array_equal(integrate(name, initial, reordered, dt, steps), data), "Parameter order changed the result"
+
+        print(f"  ✓ Matches reference RK4 (max diff {np.abs(data - reference).max():.2e})")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return False
+
+
+def test_batch_matches_single(name, attractor_def):
+    """Test that batched integration matches integrating each lane alone."""
+    print(f"\nTesting {name} batch integrator...")
+
+    inits = np.array([[0.1, 0.0, 0.0], [0.2, 0.1, 0.0], [0.0, 1.0, 0.5]], dtype=float)
+    dt = 0.01
+    steps = 300
+
+    try:
+        data = integrate_batch(attractor_def["deriv"], inits, attractor_def["params"], dt, steps)
+        assert data.shape == (steps, len(inits), 3), f"Expected shape ({steps}, {len(inits)}, 3), got {data.shape}"
+
+        for b, initial in enumerate(inits):
+            single = rk4_integrate(attractor_def["deriv"], initial, attractor_def["params"], dt, steps)
+            assert np.allclose(data[:, b], single, rtol=1e-9, atol=1e-9), f"Lane {b} diverges from single run"
+
+        # A single lane must work too, and the caller's initial states must not be modified
+        one = inits[:1].copy()
+        lane = integrate_batch(attractor_def["deriv"], one, attractor_def["params"], dt, steps)
+        assert np.allclose(lane[:, 0], data[:, 0], rtol=1e-9, atol=1e-9), "Single-lane batch diverges"
+        assert np.array_equal(one, inits[:1]), "Initial states were modified in place"
+
+        print(f"  ✓ {len(inits)} lanes match single-trajectory RK4")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return False
+
+
+def test_many_matches_single(name, attractor_def):
+    """Test that the parallel ensemble driver matches integrating each trajectory alone."""
+    print(f"\nTesting {name} parallel ensemble integrator...")
+
+    inits = np.array([[0.1, 0.0, 0.0], [0.2, 0.1, 0.0], [0.0, 1.0, 0.5]], dtype=float)
+    dt = 0.01
+    steps = 300
+
+    try:
+        data = integrate_many(name, inits, attractor_def["params"], dt, steps)
+        assert data.shape == (len(inits), steps, 3), f"Expected shape ({len(inits)}, {steps}, 3), got {data.shape}"
+
+        for b, initial in enumerate(inits):
+            single = integrate(name, initial, attractor_def["params"], dt, steps)
+            assert np.allclose(data[b], single, rtol=1e-9, atol=1e-9), f"Trajectory {b} diverges from single run"
+
+        print(f"  ✓ {len(inits)} trajectories match single-trajectory integration")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return False
+
+
+def test_cuda_matches_cpu(name, attractor_def):
+    """Test that the CUDA batch kernel matches the CPU integrator, including striding."""
+    print(f"\nTesting {name} CUDA integrator...")
+
+    if not HAVE_CUDA:
+        print("  - Skipped (no CUDA device)")
+        return True
+
+    inits = np.array([[0.1, 0.0, 0.0], [0.2, 0.1, 0.0], [0.0, 1.0, 0.5]], dtype=float)
+    dt = 0.01
+    steps = 300
+    stride = 4
+
+    try:
+        data = integrate_many_cuda(name, inits, attractor_def["params"], dt, steps, stride=stride)
+        for b, initial in enumerate(inits):
+            single = integrate(name, initial, attractor_def["params"], dt, steps)[::stride]
+            assert np.allclose(data[b], single, rtol=1e-9, atol=1e-9), f"Trajectory {b} diverges from CPU run"
+
+        print(f"  ✓ {len(inits)} trajectories match CPU integration")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return False
+
+
+def test_adaptive_matches_rk4(name, attractor_def):
+    """Test that adaptive solve_ivp integration agrees with RK4 over a short horizon."""
+    print(f"\nTesting {name} adaptive integrator...")
+
+    if not HAVE_SCIPY:
+        print("  - Skipped (SciPy not installed)")
+        return True
+
+    initial = np.array([0.1, 0.0, 0.0], dtype=float)
+    dt = 0.01
+    steps = 200
+
+    try:
+        reference = integrate(name, initial, attractor_def["params"], dt, steps)
+        data = integrate_adaptive(name, initial, attractor_def["params"], dt, steps)
+
+        assert data.shape == reference.shape, f"Expected shape {reference.shape}, got {data.shape}"
+        assert np.allclose(data, reference, rtol=1e-4, atol=1e-3), "Adaptive trajectory diverges from RK4"
+
+        print(f"  ✓ Matches RK4 (max diff {np.abs(data - reference).max():.2e})")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return False
+
+
+def test_adaptive_short_runs(name, attractor_def):
+    """Test adaptive integration with one sample and with none."""
+    print(f"\nTesting {name} adaptive integrator with steps=1 and steps=0...")
+
+    try:
+        data = integrate_adaptive(name, attractor_def["init"], attractor_def["params"], 0.01, 1)
+        assert data.shape == (1, 3), f"Expected shape (1, 3), got {data.shape}"
+        assert np.array_equal(data[0], attractor_def["init"]), "Single sample is not the initial state"
+        try:
+            integrate_adaptive(name, attractor_def["init"], attractor_def["params"], 0.01, 0)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("steps=0 did not raise ValueError")
+        print("  ✓ steps=1 returns the initial state, steps=0 raises ValueError")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return False
+
+
+def test_tsit5_matches_rk4(name, attractor_def):
+    """Test that fixed-step Tsit5 agrees with RK4 over a short horizon."""
+    print(f"\nTesting {name} Tsit5 integrator...")
+
+    dt = 0.005
+    steps = 200
+
+    try:
+        data = integrate_tsit5(name, attractor_def["init"], attractor_def["params"], dt, steps)
+        reference = integrate(name, attractor_def["init"], attractor_def["params"], dt, steps)
+        assert data.shape == (steps, 3), f"Expected shape ({steps}, 3), got {data.shape}"
+        assert np.allclose(data, reference, rtol=1e-4, atol=1e-3), "Tsit5 diverges from RK4"
+
+        print(f"  ✓ Matches RK4 (max diff {np.abs(data - reference).max():.2e})")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return False
+
+
+def test_solvers_agree(name, attractor_def):
+    """Test that every selectable solver agrees with RK4 over a short horizon."""
+    print(f"\nTesting {name} solver selection...")
+
+    dt = 0.005
+    steps = 200
+
+    try:
+        reference = integrate(name, attractor_def["init"], attractor_def["params"], dt, steps)
+        for solver in SOLVERS:
+            if solver in SCIPY_SOLVERS and not HAVE_SCIPY:
+                print(f"  - Skipped {solver} (SciPy not installed)")
+                continue
+            data = integrate_with(solver, name, attractor_def["init"], attractor_def["params"], dt, steps)
+            assert data.shape == (steps, 3), f"{solver}: expected shape ({steps}, 3), got {data.shape}"
+            assert np.allclose(data, reference, rtol=1e-4, atol=1e-3), f"{solver} diverges from RK4"
+            print(f"  ✓ {solver} matches RK4 (max diff {np.abs(data - reference).max():.2e})")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return False
+
+
+def test_tsit5_adaptive_tolerance(name, attractor_def):
+    """Test that adaptive Tsit5's interpolated samples tighten with rtol."""
+    print(f"\nTesting {name} adaptive Tsit5 tolerance...")
+
+    dt = 0.005
+    steps = 400
+
+    try:
+        # RK4 at a tenth of the step is accurate to well below either tolerance
+        reference = integrate(name, attractor_def["init"], attractor_def["params"], dt / 10, steps * 10)[::10]
+        errors = []
+        for rtol in (1e-5, 1e-9):
+            data = integrate_with("Tsit5-adaptive", name, attractor_def["init"], attractor_def["params"],
+                                  dt, steps, rtol=rtol)
+            assert data.shape == (steps, 3), f"rtol={rtol}: expected shape ({steps}, 3), got {data.shape}"
+            errors.append(np.abs(data - reference).max())
+        assert errors[1] < 1e-5, f"rtol=1e-9 error {errors[1]:.2e} too large"
+        assert errors[1] <= errors[0], f"tighter rtol did not reduce error ({errors[0]:.2e} -> {errors[1]:.2e})"
+        print(f"  ✓ Max diff {errors[0]:.2e} at rtol=1e-5, {errors[1]:.2e} at rtol=1e-9")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return False
+
+
+def test_tsit5_adaptive_rejects_bad_input(name, attractor_def):
+    """Test that adaptive Tsit5 raises on a bad dt or a diverging state instead of hanging."""
+    print(f"\nTesting {name} adaptive Tsit5 input checks...")
+
+    cases = [(attractor_def["init"], 0.0, ValueError),
+             (attractor_def["init"], -0.01, ValueError),
+             (attractor_def["init"], float("nan"), ValueError),
+             ([float("nan")] * 3, 0.01, RuntimeError),
+             ([float("inf")] * 3, 0.01, RuntimeError)]
+    try:
+        for initial, dt, error in cases:
+            try:
+                integrate_with("Tsit5-adaptive", name, initial, attractor_def["params"], dt, 100)
+            except error:
+                pass
+            else:
+                raise AssertionError(f"initial={initial}, dt={dt} did not raise {error.__name__}")
+        print("  ✓ Bad dt raises ValueError, diverging state raises RuntimeError")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return False
+
+
+def test_continuation_matches_full_run(name, attractor_def):
+    """Test that continuing a run from its final state reproduces a longer run."""
+    print(f"\nTesting {name} continued integration...")
+
+    dt = 0.01
+    steps = 400
+
+    try:
+        inits = np.array([attractor_def["init"], [0.2, 0.1, 0.0]], dtype=float)
+        for solver in FIXED_STEP_SOLVERS:
+            full = integrate_with(solver, name, attractor_def["init"], attractor_def["params"], dt, 2 * steps - 1)
+            head = integrate_with(solver, name, attractor_def["init"], attractor_def["params"], dt, steps)
+            tail = integrate_with(solver, name, head[-1], attractor_def["params"], dt, steps)
+            assert np.array_equal(np.concatenate((head, tail[1:])), full), f"{solver}: continued run differs"
+
+        full = integrate_many(name, inits, attractor_def["params"], dt, 2 * steps - 1)
+        head = integrate_many(name, inits, attractor_def["params"], dt, steps)
+        tail = integrate_many(name, head[:, -1], attractor_def["params"], dt, steps)
+        assert np.array_equal(np.concatenate((head, tail[:, 1:]), axis=1), full), "Continued batch differs"
+
+        print(f"  ✓ Continued runs match single runs exactly")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return False
+
+
+def test_zero_steps_rejected(name, attractor_def):
+    """Test that a step count below 1 raises ValueError instead of reaching a kernel."""
+    print(f"\nTesting {name} rejects steps=0...")
+
+    try:
+        for solver in SOLVERS:
+            try:
+                integrate_with(solver, name, attractor_def["init"], attractor_def["params"], 0.01, 0)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"{solver} accepted steps=0")
+        for func, initial in ((integrate, attractor_def["init"]),
+                              (integrate_specialized, attractor_def["init"]),
+                              (integrate_many, [attractor_def["init"]] * 4),
+                              (integrate_many_cuda, [attractor_def["init"]] * 4)):
+            try:
+                func(name, initial, attractor_def["params"], 0.01, 0)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"{func.__name__} accepted steps=0")
+        print("  ✓ steps=0 raises ValueError for every solver and batch path")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return False
+
+
+def test_specialized_matches_jit(name, attractor_def):
+    """Test that the generated, parameter-specialized stepper matches the JIT kernel."""
+    print(f"\nTesting {name} specialized stepper...")
+
+    dt = 0.01
+    steps = 500
+
+    try:
+        data = integrate_specialized(name, attractor_def["init"], attractor_def["params"], dt, steps)
+        reference = integrate(name, attractor_def["init"], attractor_def["params"], dt, steps)
+        assert np.allclose(data, reference, rtol=1e-9, atol=1e-9), "Specialized stepper diverges from JIT kernel"
+
+        print(f"  ✓ Matches JIT kernel (max diff {np.abs(data - reference).max():.2e})")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return False
+
+
+def test_data_bounds(name, attractor_def):
+    """Test that the single-pass bounds match NumPy's min and max."""
+    print(f"\nTesting {name} data bounds...")
+
+    try:
+        data = integrate(name, attractor_def["init"], attractor_def["params"], 0.01, 2000)
+        mins, maxs = data_bounds(data)
+        assert np.array_equal(mins, data.min(axis=0)), "Minimums differ from NumPy"
+        assert np.array_equal(maxs, data.max(axis=0)), "Maximums differ from NumPy"
+
+        print(f"  ✓ Bounds match NumPy")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return False
+
+
 def main():
     """Run tests on all attractors."""
     print("=" * 60)
@@ -48,6 +410,34 @@ def main():
         passed = test_attractor(name, attractor_def)
         if not passed:
             all_passed = False
+        if not test_jit_matches_reference(name, attractor_def):
+            all_passed = False
+        if not test_batch_matches_single(name, attractor_def):
+            all_passed = False
+        if not test_many_matches_single(name, attractor_def):
+            all_passed = False
+        if not test_cuda_matches_cpu(name, attractor_def):
+            all_passed = False
+        if not test_adaptive_matches_rk4(name, attractor_def):
+            all_passed = False
+        if not test_adaptive_short_runs(name, attractor_def):
+            all_passed = False
+        if not test_tsit5_matches_rk4(name, attractor_def):
+            all_passed = False
+        if not test_solvers_agree(name, attractor_def):
+            all_passed = False
+        if not test_tsit5_adaptive_tolerance(name, attractor_def):
+            all_passed = False
+        if not test_tsit5_adaptive_rejects_bad_input(name, attractor_def):
+            all_passed = False
+        if not test_continuation_matches_full_run(name, attractor_def):
+            all_passed = False
+        if not test_zero_steps_rejected(name, attractor_def):
+            all_passed = False
+        if not test_specialized_matches_jit(name, attractor_def):
+            all_passed = False
+        if not test_data_bounds(name, attractor_def):
+            all_passed = False
 
     print("\n" + "=" * 60)
     if all_passed: